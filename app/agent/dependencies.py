@@ -11,9 +11,13 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OnboardingDeps:
-    """Runtime dependencies injected into the onboarding agent."""
+    """Runtime dependencies injected into the onboarding agent.
+
+    Slotted: every tool call reads and writes these fields, so they are
+    stored as fixed slots rather than in a per-instance ``__dict__``.
+    """
 
     account_id: str
     correlation_id: str = ""
@@ -4,10 +4,27 @@ from .opportunity import check_opportunity_invariants
 from .user import check_user_invariants
 from .invoice import check_invoice_invariants
 
+# Every domain checker, in the order their issues should be reported
+ALL_INVARIANT_CHECKS = (
+    check_account_invariants,
+    check_user_invariants,
+    check_opportunity_invariants,
+    check_contract_invariants,
+    check_invoice_invariants,
+)
+
+
+def check_all_invariants(state: dict) -> None:
+    """Run every domain's invariant checks against state in one pass."""
+    for check in ALL_INVARIANT_CHECKS:
+        check(state)
+
+
 __all__ = [
     "check_account_invariants",
     "check_contract_invariants", 
     "check_opportunity_invariants",
     "check_user_invariants",
     "check_invoice_invariants",
+    "check_all_invariants",
 ]
@@ -19,6 +19,7 @@ Model selection:
 - Falls back to Ollama local model when no API key is available
 """
 
+import asyncio
 import json
 import os
 from typing import Any, Dict
@@ -419,13 +420,8 @@ async def validate_business_rules(
 
     Returns: {"violations": {...}, "warnings": {...}}
     """
-    from app.agent.invariants import (
-        check_account_invariants,
-        check_user_invariants,
-        check_opportunity_invariants,
-        check_contract_invariants,
-        check_invoice_invariants,
-    )
+    from app.agent.invariants import check_all_invariants
+    from app.agent.state_utils import init_state, has_blockers, has_warnings
 
     log_event("tool.validation.run_all", account_id=ctx.deps.account_id,
               correlation_id=ctx.deps.correlation_id)
@@ -440,31 +436,25 @@ async def validate_business_rules(
                 ctx.deps.collected_user = user_data
 
     # Use the complete data stored by fetch tools — avoids LLM data truncation
-    state: Dict[str, Any] = {
-        "account": ctx.deps.collected_account,
-        "user": ctx.deps.collected_user,
-        "opportunity": ctx.deps.collected_opportunity,
-        "contract": ctx.deps.collected_contract,
-        "invoice": ctx.deps.collected_invoice,
-        "clm": ctx.deps.collected_clm,
-        "violations": {},
-        "warnings": {},
-    }
+    state: Dict[str, Any] = init_state(
+        account=ctx.deps.collected_account,
+        user=ctx.deps.collected_user,
+        opportunity=ctx.deps.collected_opportunity,
+        contract=ctx.deps.collected_contract,
+        invoice=ctx.deps.collected_invoice,
+        clm=ctx.deps.collected_clm,
+    )
 
-    check_account_invariants(state)
-    check_user_invariants(state)
-    check_opportunity_invariants(state)
-    check_contract_invariants(state)
-    check_invoice_invariants(state)
+    check_all_invariants(state)
 
     violations = state.get("violations", {})
     warnings = state.get("warnings", {})
-    has_violations = any(violations.values())
-    has_warnings = any(warnings.values())
+    blocked = has_blockers(state)
+    warned = has_warnings(state)
 
-    if has_violations:
+    if blocked:
         decision_guidance = "BLOCK — violations found (these are blocking issues)"
-    elif has_warnings:
+    elif warned:
         decision_guidance = "ESCALATE — warnings found but NO violations (non-blocking, needs review)"
     else:
         decision_guidance = "PROCEED — no violations and no warnings"
@@ -473,8 +463,8 @@ async def validate_business_rules(
         "violations": violations,
         "warnings": warnings,
         "decision_guidance": decision_guidance,
-        "has_violations": has_violations,
-        "has_warnings": has_warnings,
+        "has_violations": blocked,
+        "has_warnings": warned,
     }
 
 
@@ -718,7 +708,9 @@ async def convert_currency(
         correlation_id=ctx.deps.correlation_id,
     )
 
-    return currency.convert_currency(
+    # The Frankfurter client is synchronous; run it off the event loop
+    return await asyncio.to_thread(
+        currency.convert_currency,
         amount, from_currency, to_currency, date=date or None,
     )
 
@@ -847,11 +839,13 @@ async def simulate_issue_resolution(
     Use this before re-running onboarding when a blocked or escalated account
     needs to move forward in the demo environment.
     """
+    from app.agent.response_cache import onboarding_cache
     from app.integrations import resolution
 
     account_id = ctx.deps.account_id
     log_event("tool.resolution.simulate", account_id=account_id,
               correlation_id=ctx.deps.correlation_id)
+    onboarding_cache.invalidate_account(account_id)
     return resolution.simulate_issue_resolution(account_id)
 
 
@@ -906,7 +900,8 @@ async def check_financial_alignment(
             normalized_inv_total = inv_total
 
             if inv_currency != opp_currency:
-                conversion = currency.convert_currency(
+                conversion = await asyncio.to_thread(
+                    currency.convert_currency,
                     inv_total, inv_currency, opp_currency, date=inv_date,
                 )
                 if conversion.get("status") == "OK":
@@ -0,0 +1,116 @@
+"""
+In-memory TTL cache for completed onboarding runs.
+
+Salesforce can fire the same "Closed Won" trigger more than once, and the
+CS team retries runs by hand. Each of those would otherwise pay for a full
+agent run (LLM calls plus every integration fetch) and repeat its side
+effects. Runs are keyed on the account and event type, so a duplicate
+within the TTL reuses the first run's final state and, once written, its
+report files.
+
+Only clean, completed runs are cached: a run that hit API errors may well
+succeed on retry. Anything that changes an account's source data (issue
+resolution, executed actions) must call invalidate_account so the next
+trigger sees the change. The cache is off unless
+ONBOARDING_CACHE_TTL_SECONDS is set.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class CachedRun:
+    """A completed onboarding run and the reports generated for it (if any)."""
+    final_state: Dict[str, Any]
+    generated_reports: Optional[Dict[str, str]] = None
+
+    def reports_on_disk(self) -> Optional[Dict[str, str]]:
+        """The cached report paths, or None if absent or any file is gone."""
+        reports = self.generated_reports
+        if reports and all(map(os.path.exists, reports.values())):
+            return reports
+        return None
+
+
+class ResponseCache:
+    """Bounded, TTL-expiring map of (account_id, event_type) -> CachedRun."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, tuple[float, CachedRun]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(account_id: str, event_type: str) -> CacheKey:
+        """Key for an onboarding trigger."""
+        return (account_id, event_type)
+
+    @staticmethod
+    def is_cacheable(state: Dict[str, Any]) -> bool:
+        """Whether a run's final state is safe to replay for a duplicate trigger."""
+        return state.get("stage") == "complete" and not state.get("api_errors")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: CacheKey) -> Optional[CachedRun]:
+        """Return the cached run for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: CacheKey, state: Dict[str, Any]) -> None:
+        """Store state under key, evicting the least recently used entry if full.
+
+        Runs that did not complete cleanly (see is_cacheable) are not stored.
+        """
+        if not self.enabled or not self.is_cacheable(state):
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, CachedRun(state))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set_reports(self, key: CacheKey, generated_reports: Dict[str, str]) -> None:
+        """Attach report paths to the cached run for key, if it is still cached."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1].generated_reports = generated_reports
+
+    def invalidate_account(self, account_id: str) -> None:
+        """Drop every cached run for account_id, e.g. after its data changed."""
+        for key in [k for k in self._entries if k[0] == account_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared by the webhook; opt in with ONBOARDING_CACHE_TTL_SECONDS > 0.
+onboarding_cache = ResponseCache(
+    ttl_seconds=float(os.getenv("ONBOARDING_CACHE_TTL_SECONDS", "0")),
+)
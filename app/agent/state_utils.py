@@ -3,20 +3,46 @@ Minimal state utility functions used by the invariant checkers.
 
 These helpers mutate a dict-based state to add violations and warnings.
 They are used by the business rule validators in app/agent/invariants/.
+States are built with init_state(), which creates ``violations`` and
+``warnings`` as ``defaultdict(list)`` so a write is a single
+``state[key][domain].append(...)``.
 """
 
+from collections import defaultdict
 from typing import Dict, Any
 
 
-def add_violation(state: dict, domain: str, message: str) -> None:
-    """Record a blocking invariant violation."""
-    if state.get("violations") is None:
-        state["violations"] = {}
-    state["violations"].setdefault(domain, []).append(message)
+# Domain records every validation state carries (None until fetched).
+# Only immutable defaults live here; containers are created per call.
+_STATE_TEMPLATE: Dict[str, Any] = dict.fromkeys(
+    ("account", "user", "opportunity", "contract", "invoice", "clm")
+)
 
 
-def add_warning(state: dict, domain: str, message: str) -> None:
-    """Record a non-blocking warning."""
-    if state.get("warnings") is None:
-        state["warnings"] = {}
-    state["warnings"].setdefault(domain, []).append(message)
+def init_state(**fields: Any) -> Dict[str, Any]:
+    """Build a fresh state dict for the invariant checkers."""
+    state = _STATE_TEMPLATE.copy()
+    state.update(fields)
+    state["violations"] = defaultdict(list)
+    state["warnings"] = defaultdict(list)
+    return state
+
+
+def add_violation(state: Dict[str, Any], domain: str, message: str) -> None:
+    """Record a blocking invariant violation (state from init_state())."""
+    state["violations"][domain].append(message)
+
+
+def add_warning(state: Dict[str, Any], domain: str, message: str) -> None:
+    """Record a non-blocking warning (state from init_state())."""
+    state["warnings"][domain].append(message)
+
+
+def has_blockers(state: Dict[str, Any]) -> bool:
+    """Return True if any domain recorded a blocking violation."""
+    return any((state.get("violations") or {}).values())
+
+
+def has_warnings(state: Dict[str, Any]) -> bool:
+    """Return True if any domain recorded a warning."""
+    return any((state.get("warnings") or {}).values())
@@ -2,18 +2,29 @@
 Demo API endpoints for showcasing the onboarding agent.
 """
 
-from fastapi import APIRouter, Query
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import HTMLResponse, FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from app.agent import run_onboarding_async
+from app.agent.response_cache import onboarding_cache
 from app.notifications import get_sent_notifications, clear_notifications
+from app.integrations import provisioning
 from app.integrations.provisioning import reset_all as reset_provisioning
 from app.integrations.resolution import reset_resolution_state, simulate_issue_resolution
-from app.integrations.api_errors import enable_error_simulation, disable_error_simulation
-from app.reports import generate_full_run_report, REPORTS_DIR
+from app.integrations.api_errors import ERROR_SIMULATOR, enable_error_simulation, disable_error_simulation
+from app.reports import generate_full_run_report, mark_reports_changed, reports_version, REPORTS_DIR
+from app.api.responses import FastJSONResponse, encode_json
+from app.logging.logger import log_error
+from collections import defaultdict
+from operator import itemgetter
+from urllib.parse import quote
+import asyncio
+import gzip
+import json
 import os
+import stat
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 # All demo scenarios
 ALL_SCENARIOS = [
@@ -89,8 +100,23 @@ ALL_SCENARIOS = [
     },
 ]
 
+# O(1) scenario lookup by account ID. Unknown IDs are still runnable
+# (error-simulation accounts, chat-driven onboardings), they just have no name.
+SCENARIO_BY_ID: dict[str, dict] = {s["id"]: s for s in ALL_SCENARIOS}
 
-ERROR_SIMULATION_IDS = {"AUTH-ERROR", "PERM-ERROR", "SERVER-ERROR", "RATE-ERROR", "VALIDATION-ERROR"}
+_REPORTS_PREFIX = os.path.realpath(REPORTS_DIR).rstrip(os.sep) + os.sep
+
+# Behind nginx, downloads can be delegated with X-Accel-Redirect instead of
+# streaming every byte through the worker
+USE_XACCEL = os.environ.get("USE_XACCEL_REDIRECT") == "1"
+XACCEL_PREFIX = os.environ.get("XACCEL_REPORTS_PREFIX", "/internal-reports/")
+
+# ALL_SCENARIOS never changes at runtime, so /scenarios serves bytes encoded once
+_SCENARIOS_BODY = json.dumps({"scenarios": ALL_SCENARIOS}).encode()
+_SCENARIOS_BODY_GZIP = gzip.compress(_SCENARIOS_BODY, compresslevel=6)
+
+
+ERROR_SIMULATION_IDS = frozenset({"AUTH-ERROR", "PERM-ERROR", "SERVER-ERROR", "RATE-ERROR", "VALIDATION-ERROR"})
 
 # In-memory store for ALL onboarding run results (not just provisioned ones)
 _ALL_RUN_RESULTS: dict[str, dict] = {}
@@ -99,61 +125,195 @@ def is_error_simulation_scenario(account_id: str) -> bool:
     return account_id in ERROR_SIMULATION_IDS or account_id.endswith("-ERROR")
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (honouring q=0 refusals)."""
+    gzip_q = wildcard_q = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "gzip":
+            gzip_q = q
+        else:
+            wildcard_q = q
+    q = gzip_q if gzip_q is not None else wildcard_q
+    return q is not None and q > 0
+
+
 @router.get("/scenarios")
-async def list_scenarios():
+async def list_scenarios(request: Request):
     """List available demo scenarios."""
-    return {"scenarios": ALL_SCENARIOS}
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=_SCENARIOS_BODY_GZIP,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=_SCENARIOS_BODY,
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
 
 
-@router.post("/run/{account_id}")
-async def run_demo_scenario(account_id: str, generate_report: bool = False):
-    """Run a specific demo scenario by account ID."""
-    clear_notifications()
+# Agent state keys surfaced in run responses, pulled out in a single call
+_RUN_RESULT_KEYS = (
+    "decision", "stage", "risk_analysis", "violations",
+    "warnings", "actions_taken", "provisioning", "human_summary",
+)
+_RUN_RESULT_FIELDS = itemgetter(*_RUN_RESULT_KEYS)
+_RUN_RESULT_DEFAULTS = dict.fromkeys(_RUN_RESULT_KEYS)
 
-    result = await run_onboarding_async(
-        account_id=account_id,
-        event_type="demo.trigger",
-    )
 
+def _build_run_response(account_id: str, result: dict) -> dict:
+    """Shape an agent run result for the dashboard and store it."""
     notifications = get_sent_notifications(account_id)
 
     # Look up scenario name for dashboard display
-    scenario_name = ""
-    for s in ALL_SCENARIOS:
-        if s["id"] == account_id:
-            scenario_name = s["name"]
-            break
+    scenario = SCENARIO_BY_ID.get(account_id)
+    scenario_name = scenario["name"] if scenario else ""
+
+    decision, stage, risk_analysis, violations, warnings, actions_taken, provisioning, summary = (
+        _RUN_RESULT_FIELDS({**_RUN_RESULT_DEFAULTS, **result})
+    )
 
     response = {
         "account_id": account_id,
-        "decision": result.get("decision"),
-        "stage": result.get("stage"),
-        "risk_analysis": result.get("risk_analysis"),
-        "violations": result.get("violations"),
-        "warnings": result.get("warnings"),
-        "actions_taken": result.get("actions_taken"),
+        "decision": decision,
+        "stage": stage,
+        "risk_analysis": risk_analysis,
+        "violations": violations,
+        "warnings": warnings,
+        "actions_taken": actions_taken,
         "notifications_sent": notifications,
-        "provisioning": result.get("provisioning"),
-        "summary": result.get("human_summary"),
+        "provisioning": provisioning,
+        "summary": summary,
         "scenario_name": scenario_name,
     }
 
     # Store result for dashboard
     _ALL_RUN_RESULTS[account_id] = response
+    return response
+
+
+@router.post("/run/{account_id}")
+async def run_demo_scenario(account_id: str, generate_report: bool = False):
+    """Run a specific demo scenario by account ID."""
+    clear_notifications()
+
+    result = await run_onboarding_async(
+        account_id=account_id,
+        event_type="demo.trigger",
+    )
+
+    response = _build_run_response(account_id, result)
 
     if generate_report:
-        if is_error_simulation_scenario(account_id):
-            response["generated_reports"] = None
-            response["report_skipped_reason"] = "Reports are not generated for error simulation scenarios"
-        else:
-            generated_files = generate_full_run_report(result)
-            response["generated_reports"] = {
-                k: os.path.basename(v) for k, v in generated_files.items()
-            }
+        await _attach_reports(response, account_id, result)
+
+    return response
+
+
+async def _attach_reports(response: dict, account_id: str, result: dict) -> None:
+    """Generate the run's reports in a worker thread and list them on the response."""
+    if is_error_simulation_scenario(account_id):
+        response["generated_reports"] = None
+        response["report_skipped_reason"] = "Reports are not generated for error simulation scenarios"
+        return
+
+    generated_files = await asyncio.to_thread(generate_full_run_report, result)
+    response["generated_reports"] = {
+        k: os.path.basename(v) for k, v in generated_files.items()
+    }
+
+
+# Upper bound on agent runs /run-all keeps in flight, so a batch doesn't
+# trip the LLM provider's rate limits.
+BATCH_CONCURRENCY = int(os.getenv("DEMO_BATCH_CONCURRENCY", "5"))
 
+
+async def _run_batch_scenario(
+    account_id: str,
+    generate_report: bool,
+    limiter: asyncio.Semaphore,
+) -> dict:
+    """Run one /run-all scenario; a failed agent run is reported in place."""
+    try:
+        async with limiter:
+            result = await run_onboarding_async(account_id=account_id, event_type="demo.batch")
+    except Exception as e:
+        log_error("demo.batch.run_failed", e, account_id=account_id)
+        return {"account_id": account_id, "error": str(e)}
+
+    response = _build_run_response(account_id, result)
+    if generate_report:
+        await _attach_reports(response, account_id, result)
     return response
 
 
+@router.post("/run-all")
+async def run_all_scenarios(generate_report: bool = False, stream: bool = False):
+    """
+    Run every demo scenario in one batch.
+
+    Shared demo state is reset once up front, then the agent runs are
+    awaited together with asyncio.gather (at most BATCH_CONCURRENCY at a
+    time) so the batch takes a fraction of the sum of all of them.
+    Report generation, when requested, is fanned out the same way.
+
+    With ``stream=true`` the results are sent as NDJSON, one line per
+    scenario in completion order, between a ``start`` and a ``summary`` line.
+    """
+    clear_notifications()
+    reset_provisioning()
+
+    account_ids = list(SCENARIO_BY_ID)
+
+    if stream:
+        return StreamingResponse(
+            _stream_batch(account_ids, generate_report),
+            media_type="application/x-ndjson",
+        )
+
+    limiter = asyncio.Semaphore(BATCH_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_run_batch_scenario(account_id, generate_report, limiter) for account_id in account_ids)
+    )
+
+    # Returned as a ready Response to skip jsonable_encoder on the large body
+    return FastJSONResponse({"total": len(results), "results": results})
+
+
+async def _stream_batch(account_ids: list[str], generate_report: bool):
+    """Yield NDJSON lines for a /run-all batch as each scenario finishes."""
+    limiter = asyncio.Semaphore(BATCH_CONCURRENCY)
+    tasks = [
+        asyncio.ensure_future(_run_batch_scenario(account_id, generate_report, limiter))
+        for account_id in account_ids
+    ]
+    try:
+        yield encode_json({"type": "start", "total": len(tasks)}) + b"\n"
+        failed = 0
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            failed += "error" in result
+            yield encode_json({"type": "result", **result}) + b"\n"
+        yield encode_json({"type": "summary", "total": len(tasks), "failed": failed}) + b"\n"
+    finally:
+        # Client went away mid-batch: don't leave agent runs going
+        for task in tasks:
+            task.cancel()
+
+
 @router.post("/enable-random-errors")
 async def enable_random_errors(
     auth_rate: float = Query(default=0.05, ge=0.0, le=1.0, description="Authentication error probability (0-1)"),
@@ -169,8 +329,6 @@ async def enable_random_errors(
         server_error_rate=server_error_rate
     )
 
-    from app.integrations.api_errors import ERROR_SIMULATOR
-
     return {
         "status": "enabled",
         "message": "Error simulation is now ACTIVE.",
@@ -200,8 +358,6 @@ async def disable_random_errors():
 @router.get("/error-simulator-status")
 async def get_error_simulator_status():
     """Check the current state of the error simulator."""
-    from app.integrations.api_errors import ERROR_SIMULATOR
-
     return {
         "enabled": ERROR_SIMULATOR.enabled,
         "rates": {
@@ -228,78 +384,61 @@ async def reset_demo():
     disable_error_simulation()
     _ALL_RUN_RESULTS.clear()
     _CHAT_SESSIONS.clear()
+    onboarding_cache.clear()
 
-    if os.path.exists(REPORTS_DIR):
-        for f in os.listdir(REPORTS_DIR):
-            if f != ".gitkeep":
-                try:
-                    os.remove(os.path.join(REPORTS_DIR, f))
-                except Exception:
-                    pass
+    await asyncio.to_thread(_clear_reports)
 
     return {"status": "reset", "message": "Demo state and reports cleared"}
 
 
-# ============================================================================
-# REPORT ENDPOINTS
-# ============================================================================
-
-@router.get("/reports")
-async def list_reports():
-    """List all generated reports."""
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-
-    files = [f for f in os.listdir(REPORTS_DIR) if f != ".gitkeep"]
-
-    reports = {
-        "html_emails": sorted([f for f in files if f.endswith(".html")], reverse=True),
-        "markdown_reports": sorted([f for f in files if f.endswith(".md")], reverse=True),
-        "audit_logs": sorted([f for f in files if f.endswith(".json")], reverse=True),
-    }
-
-    return {
-        "reports_directory": REPORTS_DIR,
-        "total_reports": len(files),
-        "reports": reports,
-        "view_url_template": "/demo/reports/{filename}",
-        "download_url_template": "/demo/reports/{filename}/download",
-    }
-
-
-@router.get("/reports/{filename}", response_class=HTMLResponse)
-async def get_report(filename: str):
-    """Get a specific report file."""
-    os.makedirs(REPORTS_DIR, exist_ok=True)
+def _clear_reports() -> None:
+    """Delete every generated report, keeping the .gitkeep placeholder."""
+    try:
+        with os.scandir(REPORTS_DIR) as entries:
+            paths = [e.path for e in entries if e.name != ".gitkeep"]
+    except FileNotFoundError:
+        return
 
-    filepath = os.path.join(REPORTS_DIR, filename)
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:  # e.g. a subdirectory or a permission problem
+            log_error("demo.reset.report_delete_failed", e, path=path)
+    mark_reports_changed()
 
-    if not os.path.exists(filepath):
-        available = os.listdir(REPORTS_DIR) if os.path.exists(REPORTS_DIR) else []
-        return HTMLResponse(
-            content=f"""
-            <html>
-            <head><title>Report Not Found</title></head>
-            <body style="font-family: Arial, sans-serif; padding: 20px;">
-                <h1 style="color: #dc3545;">Report Not Found</h1>
-                <p>The file <code>{filename}</code> was not found.</p>
-                <h3>Available reports ({len(available)}):</h3>
-                <ul>
-                    {"".join(f'<li><a href="/demo/reports/{f}">{f}</a></li>' for f in available if f != '.gitkeep') or '<li>No reports generated yet</li>'}
-                </ul>
-                <p>Run a scenario via <code>POST /demo/run/{'{account_id}'}</code> to generate reports.</p>
-            </body>
-            </html>
-            """,
-            status_code=404
-        )
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+# ============================================================================
+# REPORT ENDPOINTS
+# ============================================================================
 
-    if filename.endswith(".html"):
-        return HTMLResponse(content=content)
-    elif filename.endswith(".md"):
-        return HTMLResponse(content=f"""
+def _resolve_report(filename: str) -> tuple[str, os.stat_result] | None:
+    """
+    Return (path, stat) for a report file inside REPORTS_DIR, or None.
+
+    Reports are a flat directory, so any name with a path separator (or
+    that is ``.``/``..`` itself) is rejected outright and the path is a
+    plain concatenation. Dots elsewhere in a name, as in ``acme..v2.md``,
+    are fine.
+    Anything that is not a regular file is rejected using a single lstat
+    call, so a symlink in REPORTS_DIR can't expose files outside it; the
+    stat result is handed to FileResponse so Starlette doesn't stat the
+    file again.
+    """
+    if "/" in filename or "\\" in filename or filename in (".", ".."):
+        return None
+    filepath = _REPORTS_PREFIX + filename
+    try:
+        st = os.lstat(filepath)
+    except (OSError, ValueError):  # ValueError: embedded NUL byte
+        return None
+    return (filepath, st) if stat.S_ISREG(st.st_mode) else None
+
+
+# Viewer page wrappers for markdown/JSON reports; the file content is
+# streamed between the head (formatted with the filename) and the tail.
+_MD_VIEW_HEAD = """
         <html>
         <head>
             <title>{filename}</title>
@@ -311,12 +450,8 @@ async def get_report(filename: str):
         </head>
         <body>
             <p><a href="/demo/reports">Back to Reports</a> | <a href="/demo/reports/{filename}/download">Download</a></p>
-            <pre>{content}</pre>
-        </body>
-        </html>
-        """)
-    elif filename.endswith(".json"):
-        return HTMLResponse(content=f"""
+            <pre>"""
+_JSON_VIEW_HEAD = """
         <html>
         <head>
             <title>{filename}</title>
@@ -328,32 +463,179 @@ async def get_report(filename: str):
         </head>
         <body>
             <p style="font-family: sans-serif;"><a href="/demo/reports">Back to Reports</a> | <a href="/demo/reports/{filename}/download">Download</a></p>
-            <pre>{content}</pre>
+            <pre>"""
+_VIEW_TAIL = """</pre>
         </body>
         </html>
-        """)
-    else:
-        return HTMLResponse(content=content)
+        """
 
 
-@router.get("/reports/{filename}/download")
-async def download_report(filename: str):
-    """Download a report file."""
-    filepath = os.path.join(REPORTS_DIR, filename)
+# 404 page for get_report; only the filename, count and <li> list vary.
+_NOT_FOUND_HEAD = """
+            <html>
+            <head><title>Report Not Found</title></head>
+            <body style="font-family: Arial, sans-serif; padding: 20px;">
+                <h1 style="color: #dc3545;">Report Not Found</h1>
+                <p>The file <code>{filename}</code> was not found.</p>
+                <h3>Available reports ({count}):</h3>
+                <ul>
+                    """
+_NOT_FOUND_TAIL = """
+                </ul>
+                <p>Run a scenario via <code>POST /demo/run/{account_id}</code> to generate reports.</p>
+            </body>
+            </html>
+            """
 
-    if not os.path.exists(filepath):
-        return {"error": "Report not found", "path": filepath}
 
-    if filename.endswith(".html"):
-        media_type = "text/html"
-    elif filename.endswith(".md"):
-        media_type = "text/markdown"
-    elif filename.endswith(".json"):
-        media_type = "application/json"
-    else:
-        media_type = "text/plain"
+def _stream_report_view(head: str, filepath: str):
+    """
+    Yield a report viewer page in chunks.
+
+    A plain generator: Starlette iterates it in its threadpool, so the
+    blocking file reads stay off the event loop.
+    """
+    yield head
+    with open(filepath, 'r', encoding='utf-8') as f:
+        while chunk := f.read(64 * 1024):
+            yield chunk
+    yield _VIEW_TAIL
+
+
+# Report file extension -> /reports listing bucket
+_REPORT_BUCKETS = {"html": "html_emails", "md": "markdown_reports", "json": "audit_logs"}
+
+# Report file extension -> download Content-Type (anything else is text/plain)
+_REPORT_MEDIA_TYPES = {".html": "text/html", ".md": "text/markdown", ".json": "application/json"}
+
+
+def _scan_reports() -> tuple[int, dict[str, list[str]]]:
+    """Bucket REPORTS_DIR entries by type in a single directory pass."""
+    reports: dict[str, list[str]] = {bucket: [] for bucket in _REPORT_BUCKETS.values()}
+    total = 0
+    with os.scandir(REPORTS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if name == ".gitkeep":
+                continue
+            total += 1
+            _, dot, ext = name.rpartition(".")
+            bucket = _REPORT_BUCKETS.get(ext) if dot else None
+            if bucket is not None:
+                reports[bucket].append(name)
+
+    for names in reports.values():
+        names.sort(reverse=True)
+    return total, reports
+
+
+# Constant part of the /reports listing
+_LIST_REPORTS_STATIC = {
+    "reports_directory": REPORTS_DIR,
+    "view_url_template": "/demo/reports/{filename}",
+    "download_url_template": "/demo/reports/{filename}/download",
+}
+
+# ((reports version, directory mtime_ns), response) for the last /reports
+# listing. The report writers and _clear_reports bump the version; the mtime
+# catches files added or removed by anything else.
+_REPORTS_LISTING_CACHE: tuple[tuple[int, int], dict] | None = None
+
+
+async def _report_listing() -> dict:
+    """Return the /reports listing, rescanning only when the directory changed."""
+    global _REPORTS_LISTING_CACHE
+
+    # Read the version and stat before listing: a write racing the listdir
+    # leaves an older key cached, so the next request rebuilds rather than
+    # serving a stale list.
+    # The reports package creates REPORTS_DIR at import; recreate it only if
+    # something removed it since.
+    version = reports_version()
+    try:
+        mtime_ns = os.stat(REPORTS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        mtime_ns = os.stat(REPORTS_DIR).st_mtime_ns
+    key = (version, mtime_ns)
+    if _REPORTS_LISTING_CACHE is not None and _REPORTS_LISTING_CACHE[0] == key:
+        return _REPORTS_LISTING_CACHE[1]
+
+    total, reports = await asyncio.to_thread(_scan_reports)
+
+    response = {**_LIST_REPORTS_STATIC, "total_reports": total, "reports": reports}
+    _REPORTS_LISTING_CACHE = (key, response)
+    return response
+
+
+@router.get("/reports")
+async def list_reports():
+    """List all generated reports."""
+    return await _report_listing()
+
+
+@router.get("/reports/{filename}", response_class=HTMLResponse)
+async def get_report(filename: str):
+    """Get a specific report file."""
+    resolved = _resolve_report(filename)
+
+    if resolved is None:
+        listing = await _report_listing()
+        available = [f for bucket in listing["reports"].values() for f in bucket]
+        items = "".join(f'<li><a href="/demo/reports/{f}">{f}</a></li>' for f in available)
+        return HTMLResponse(
+            content=(
+                _NOT_FOUND_HEAD.format(filename=filename, count=len(available))
+                + (items or "<li>No reports generated yet</li>")
+                + _NOT_FOUND_TAIL
+            ),
+            status_code=404
+        )
+
+    filepath, st = resolved
+
+    # HTML (and any other) reports are served as-is, straight from disk;
+    # only markdown and JSON are wrapped in a viewer page.
+    if not filename.endswith((".md", ".json")):
+        return FileResponse(filepath, media_type="text/html", stat_result=st)
+
+    head = _MD_VIEW_HEAD if filename.endswith(".md") else _JSON_VIEW_HEAD
+    return StreamingResponse(
+        _stream_report_view(head.format(filename=filename), filepath),
+        media_type="text/html",
+    )
 
-    return FileResponse(filepath, filename=filename, media_type=media_type)
+
+def _attachment_disposition(filename: str) -> str:
+    """Content-Disposition for a download, encoded as FileResponse does."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+@router.get("/reports/{filename}/download")
+async def download_report(filename: str):
+    """Download a report file."""
+    resolved = _resolve_report(filename)
+
+    if resolved is None:
+        return {"error": "Report not found", "path": _REPORTS_PREFIX + filename}
+    filepath, st = resolved
+
+    media_type = _REPORT_MEDIA_TYPES.get(os.path.splitext(filename)[1], "text/plain")
+    if USE_XACCEL:
+        # Hand the transfer to nginx; the location must be marked `internal`
+        # and alias REPORTS_DIR, e.g. `location /internal-reports/ { internal; alias /app/reports_output/; }`
+        return Response(
+            status_code=200,
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": XACCEL_PREFIX + quote(filename),
+                "Content-Disposition": _attachment_disposition(filename),
+            },
+        )
+    return FileResponse(filepath, filename=filename, media_type=media_type, stat_result=st)
 
 
 # ============================================================================
@@ -363,8 +645,6 @@ async def download_report(filename: str):
 @router.get("/tasks/{account_id}")
 async def get_onboarding_tasks(account_id: str):
     """Get all onboarding tasks for an account."""
-    from app.integrations import provisioning
-
     if not provisioning.is_provisioned(account_id):
         return {
             "error": "Account not provisioned",
@@ -375,15 +655,11 @@ async def get_onboarding_tasks(account_id: str):
     tasks = provisioning.get_onboarding_tasks(account_id)
     prov_status = provisioning.get_provisioning_status(account_id)
 
-    by_category = {}
-    for task in tasks:
-        cat = task.get("category", "other")
-        by_category.setdefault(cat, []).append(task)
-
-    by_status = {}
+    by_category = defaultdict(list)
+    by_status = defaultdict(list)
     for task in tasks:
-        status = task.get("status", "unknown")
-        by_status.setdefault(status, []).append(task)
+        by_category[task.get("category", "other")].append(task)
+        by_status[task.get("status", "unknown")].append(task)
 
     return {
         "account_id": account_id,
@@ -401,8 +677,6 @@ async def get_onboarding_tasks(account_id: str):
 @router.get("/tasks/{account_id}/pending")
 async def get_pending_tasks(account_id: str, owner: str = None):
     """Get pending onboarding tasks, optionally filtered by owner."""
-    from app.integrations import provisioning
-
     if not provisioning.is_provisioned(account_id):
         return {"error": "Account not provisioned", "account_id": account_id}
 
@@ -423,8 +697,6 @@ async def get_pending_tasks(account_id: str, owner: str = None):
 @router.get("/tasks/{account_id}/overdue")
 async def get_overdue_tasks(account_id: str):
     """Get overdue onboarding tasks."""
-    from app.integrations import provisioning
-
     if not provisioning.is_provisioned(account_id):
         return {"error": "Account not provisioned", "account_id": account_id}
 
@@ -447,8 +719,6 @@ async def update_task_status(
     notes: str = None
 ):
     """Update the status of an onboarding task."""
-    from app.integrations import provisioning
-
     valid_statuses = ["pending", "in_progress", "completed", "blocked", "skipped"]
     if status not in valid_statuses:
         return {"error": "Invalid status", "valid_statuses": valid_statuses}
@@ -463,6 +733,7 @@ async def update_task_status(
 
     if not updated_task:
         return {"error": "Task not found", "task_id": task_id}
+    onboarding_cache.invalidate_account(account_id)
 
     prov_status = provisioning.get_provisioning_status(account_id)
 
@@ -480,35 +751,30 @@ async def update_task_status(
 @router.get("/progress/{account_id}")
 async def get_onboarding_progress(account_id: str):
     """Get onboarding progress dashboard for an account."""
-    from app.integrations import provisioning
     return provisioning.check_onboarding_progress(account_id)
 
 
 @router.get("/risks/{account_id}")
 async def get_onboarding_risks(account_id: str):
     """Identify risks for an active onboarding."""
-    from app.integrations import provisioning
     return provisioning.identify_onboarding_risks(account_id)
 
 
 @router.post("/remind/{account_id}/{task_id}")
 async def remind_task(account_id: str, task_id: str, recipient: str = "", message: str = ""):
     """Send a reminder about a pending task."""
-    from app.integrations import provisioning
     return provisioning.send_task_reminder(account_id, task_id, recipient, message)
 
 
 @router.post("/escalate/{account_id}")
 async def escalate_onboarding(account_id: str, reason: str = ""):
     """Escalate a stalled onboarding to CS management."""
-    from app.integrations import provisioning
+    onboarding_cache.invalidate_account(account_id)
     return provisioning.escalate_stalled_onboarding(account_id, reason)
 
 
 def _build_proceed_entry(account_id: str, run: dict | None = None) -> dict:
     """Build a PROCEED onboarding entry from live provisioning state."""
-    from app.integrations import provisioning
-
     progress = provisioning.check_onboarding_progress(account_id)
     return {
         "account_id": account_id,
@@ -534,8 +800,6 @@ async def list_active_onboardings():
     1. _ALL_RUN_RESULTS  — populated by /run/{account_id} and execute-action
     2. provisioning store — populated by the provision_account tool (any agent)
     """
-    from app.integrations import provisioning
-
     seen: set[str] = set()
     results = []
 
@@ -597,8 +861,6 @@ async def get_sentiment(account_id: str):
 @router.get("/alerts")
 async def get_alerts():
     """Get aggregated risk alerts across all accounts (provisioned + blocked/escalated)."""
-    from app.integrations import provisioning
-
     # Alerts from provisioned accounts (task-level risks)
     alerts = provisioning.get_all_alerts()
 
@@ -643,8 +905,6 @@ async def get_portfolio_summary():
     Merges _ALL_RUN_RESULTS with the provisioning store so accounts
     onboarded via chat also appear in the portfolio view.
     """
-    from app.integrations import provisioning
-
     health_dist: dict[str, int] = {
         "completed": 0, "on_track": 0, "at_risk": 0, "stalled": 0,
         "blocked": 0, "escalated": 0,
@@ -726,7 +986,6 @@ async def get_suggested_actions():
     dashboard never shows duplicate cards for the same account.
     """
     from collections import OrderedDict
-    from app.integrations import provisioning
 
     # Collect raw per-risk actions
     raw_actions: list[dict] = provisioning.get_all_suggested_actions()
@@ -794,8 +1053,8 @@ class ExecuteActionRequest(BaseModel):
 @router.post("/execute-action")
 async def execute_action(req: ExecuteActionRequest):
     """Execute a suggested action by type."""
-    from app.integrations import provisioning
-
+    # Every action changes the account's data, so a cached webhook run is stale
+    onboarding_cache.invalidate_account(req.account_id)
     if req.action_type == "send_login_reminder":
         task_id = req.task_id or f"{req.account_id}-T009"
         return provisioning.send_task_reminder(
@@ -900,7 +1159,6 @@ async def chat_with_agent(req: ChatRequest):
     """Chat with the CS assistant agent (retains conversation history)."""
     from app.agent.onboarding_agent import cs_assistant_agent
     from app.agent.dependencies import OnboardingDeps
-    from app.integrations import provisioning
 
     deps = OnboardingDeps(account_id=req.account_id)
 
@@ -930,11 +1188,8 @@ async def chat_with_agent(req: ChatRequest):
     # (Non-provisioned accounts are already picked up by active-onboardings
     # from the provisioning store.)
     if provisioning.is_provisioned(req.account_id) and not was_provisioned:
-        scenario_name = ""
-        for s in ALL_SCENARIOS:
-            if s["id"] == req.account_id:
-                scenario_name = s["name"]
-                break
+        scenario = SCENARIO_BY_ID.get(req.account_id)
+        scenario_name = scenario["name"] if scenario else ""
         # Extract a short summary: first non-empty paragraph of the response,
         # capped at 300 characters so the dashboard card stays readable.
         _raw = result.output or ""
@@ -960,8 +1215,6 @@ async def reset_chat(session_id: str = "default"):
 @router.get("/tasks/{account_id}/next-actions")
 async def get_next_actions(account_id: str):
     """Get the next actionable tasks for CS team and customer."""
-    from app.integrations import provisioning
-
     if not provisioning.is_provisioned(account_id):
         return {"error": "Account not provisioned", "account_id": account_id}
 
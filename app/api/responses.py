@@ -0,0 +1,48 @@
+"""
+Shared JSON response helpers for the API routers.
+
+orjson is an optional speedup: when it is not installed, responses fall
+back to the stdlib json encoder with equivalent (compact, UTF-8) output.
+Content is encoded directly, not through FastAPI's jsonable_encoder, so
+values neither encoder handles natively (Pydantic models, sets, Decimal,
+...) go through jsonable_encoder only when they are reached.
+"""
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode a value the JSON encoder doesn't support natively."""
+    try:
+        return jsonable_encoder(obj)
+    except (TypeError, ValueError):
+        return str(obj)
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode to JSON bytes, using orjson when it is installed."""
+    if orjson is None:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_default,
+        ).encode()
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
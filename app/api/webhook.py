@@ -8,20 +8,114 @@ TYPICAL FLOW:
 4. Returns the decision and all relevant details
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import uuid
+from collections import OrderedDict
+from functools import partial
 
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+
+from app.api.responses import FastJSONResponse
 from app.models.events import TriggerEvent, OnboardingResponse, DebugPayload
 from app.agent import run_onboarding_async
+from app.agent.response_cache import CacheKey, onboarding_cache
 from app.logging.logger import log_event
 from app.reports import generate_full_run_report
 
-router = APIRouter(tags=["webhooks"])
+router = APIRouter(tags=["webhooks"], default_response_class=FastJSONResponse)
+
+# job id -> status of reports deferred with ?defer_reports=true
+# (oldest entries are dropped past _MAX_REPORT_JOBS). Job ids are generated
+# here rather than taken from the client's correlation_id, so reused ids
+# can't overwrite each other and one account's job can't be guessed from it.
+_REPORT_JOBS: "OrderedDict[str, dict]" = OrderedDict()
+_MAX_REPORT_JOBS = 1000
+
+
+# cache key -> task for the agent run currently in progress for it
+_INFLIGHT: dict[CacheKey, asyncio.Task] = {}
+
+
+async def _run_and_cache(cache_key: CacheKey, event: TriggerEvent) -> dict:
+    """Run the agent for event and cache the result; the task behind _INFLIGHT."""
+    state = await run_onboarding_async(
+        account_id=event.account_id,
+        correlation_id=event.correlation_id,
+        event_type=event.event_type,
+    )
+    onboarding_cache.set(cache_key, state)
+    return state
+
+
+def _finish_inflight(cache_key: CacheKey, task: asyncio.Task) -> None:
+    """Done callback: release the key and mark a failure as retrieved.
+
+    Runs even when the task was cancelled before it started, which a
+    ``finally`` inside the coroutine would not.
+    """
+    if _INFLIGHT.get(cache_key) is task:
+        del _INFLIGHT[cache_key]
+    if not task.cancelled():
+        task.exception()  # every waiter may have gone away
+
+
+async def _run_onboarding_once(cache_key: CacheKey, event: TriggerEvent) -> dict:
+    """
+    Run the agent for event, sharing one run between concurrent duplicates.
+
+    The first request for a key starts the run as its own task; duplicates
+    arriving while it is in flight await the same result instead of starting
+    their own run. Each request awaits it through a shield, so a client that
+    disconnects doesn't cancel the run for the others.
+    """
+    task = _INFLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_run_and_cache(cache_key, event))
+        task.add_done_callback(partial(_finish_inflight, cache_key))
+        _INFLIGHT[cache_key] = task
+    else:
+        log_event(
+            "webhook.coalesced",
+            account_id=event.account_id,
+            correlation_id=event.correlation_id,
+        )
+    state = await asyncio.shield(task)
+    return {**state, "correlation_id": event.correlation_id}
+
+
+def _generate_reports_job(
+    job_id: str, account_id: str, final_state: dict, cache_key: CacheKey
+) -> None:
+    """Background task: write a run's reports and record the outcome."""
+    job = _REPORT_JOBS.get(job_id)
+    if job is None:
+        return
+    try:
+        generated_reports = generate_full_run_report(final_state)
+    except Exception as report_error:
+        job.update(status="failed", error=str(report_error))
+        log_event(
+            "webhook.report_generation_failed",
+            account_id=account_id,
+            error=str(report_error),
+        )
+        return
+    job.update(status="complete", generated_reports=generated_reports)
+    onboarding_cache.set_reports(cache_key, generated_reports)
+    log_event(
+        "webhook.reports_generated",
+        account_id=account_id,
+        files=list(generated_reports.keys()),
+    )
 
 
 @router.post("/webhook/onboarding", response_model=OnboardingResponse)
 async def onboarding_webhook(
     event: TriggerEvent,
+    background_tasks: BackgroundTasks,
     generate_report: bool = True,
+    defer_reports: bool = False,
+    force_regenerate: bool = False,
 ):
     """
     Main webhook endpoint for triggering customer onboarding.
@@ -31,6 +125,14 @@ async def onboarding_webhook(
     - Validates business rules
     - Makes a decision: PROCEED, ESCALATE, or BLOCK
     - Sends notifications and/or provisions the account
+
+    With ``defer_reports=true`` the reports are written after the response
+    is sent; poll ``reports_status_url`` for the generated file paths.
+
+    When the response cache is enabled, a repeat of a recent trigger is
+    served from it (reusing its reports) and concurrent duplicates share one
+    run; ``force_regenerate=true`` bypasses both for a fresh run and fresh
+    reports.
     """
     log_event(
         "webhook.received",
@@ -40,17 +142,60 @@ async def onboarding_webhook(
     )
 
     try:
-        final_state = await run_onboarding_async(
-            account_id=event.account_id,
-            correlation_id=event.correlation_id,
-            event_type=event.event_type,
-        )
+        cache_key = onboarding_cache.make_key(event.account_id, event.event_type)
+        # Reusing another trigger's run (cached or still in flight) is opt-in
+        # via the cache TTL, and force_regenerate always asks for a fresh run
+        reuse = onboarding_cache.enabled and not force_regenerate
+        cached = onboarding_cache.get(cache_key) if reuse else None
+
+        cached_reports = None
+        if cached is not None:
+            # Duplicate trigger: reuse the earlier run instead of repeating it
+            log_event(
+                "webhook.cache_hit",
+                account_id=event.account_id,
+                correlation_id=event.correlation_id,
+                original_correlation_id=cached.final_state.get("correlation_id"),
+            )
+            final_state = {**cached.final_state, "correlation_id": event.correlation_id}
+            cached_reports = cached.reports_on_disk()
+        elif reuse:
+            final_state = await _run_onboarding_once(cache_key, event)
+        else:
+            final_state = await run_onboarding_async(
+                account_id=event.account_id,
+                correlation_id=event.correlation_id,
+                event_type=event.event_type,
+            )
+            onboarding_cache.set(cache_key, final_state)
 
         # Generate reports
         generated_reports = {}
-        if generate_report:
+        reports_status_url = None
+        if generate_report and cached_reports:
+            generated_reports = cached_reports
+        elif generate_report and defer_reports:
+            job_id = uuid.uuid4().hex
+            _REPORT_JOBS[job_id] = {
+                "status": "pending",
+                "account_id": event.account_id,
+                "correlation_id": event.correlation_id,
+            }
+            while len(_REPORT_JOBS) > _MAX_REPORT_JOBS:
+                _REPORT_JOBS.popitem(last=False)
+            background_tasks.add_task(
+                _generate_reports_job,
+                job_id,
+                event.account_id,
+                final_state,
+                cache_key,
+            )
+            reports_status_url = f"/webhook/reports/{job_id}"
+        elif generate_report:
             try:
-                generated_reports = generate_full_run_report(final_state)
+                # Report generation writes several files; keep it off the event loop
+                generated_reports = await asyncio.to_thread(generate_full_run_report, final_state)
+                onboarding_cache.set_reports(cache_key, generated_reports)
                 log_event(
                     "webhook.reports_generated",
                     account_id=event.account_id,
@@ -65,7 +210,9 @@ async def onboarding_webhook(
 
         risk_analysis = final_state.get("risk_analysis", {})
 
-        response = OnboardingResponse(
+        # final_state comes from the agent's validated OnboardingResult, so skip
+        # re-validating it here; FastAPI still checks it against response_model.
+        response = OnboardingResponse.model_construct(
             correlation_id=event.correlation_id,
             account_id=event.account_id,
             decision=final_state.get("decision", "UNKNOWN"),
@@ -79,6 +226,7 @@ async def onboarding_webhook(
             recommended_actions=risk_analysis.get("recommended_actions", []),
             provisioning=final_state.get("provisioning"),
             generated_reports=generated_reports if generated_reports else None,
+            reports_status_url=reports_status_url,
         )
 
         log_event(
@@ -101,6 +249,21 @@ async def onboarding_webhook(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/webhook/reports/{job_id}")
+async def webhook_report_status(job_id: str):
+    """Status of reports deferred by /webhook/onboarding?defer_reports=true."""
+    job = _REPORT_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No deferred report job with this id")
+    return {"job_id": job_id, **job}
+
+
+@router.get("/metrics")
+async def metrics():
+    """Onboarding response cache statistics."""
+    return {"onboarding_cache": onboarding_cache.stats()}
+
+
 @router.post("/debug/onboarding")
 async def debug_onboarding(payload: DebugPayload):
     """
@@ -109,50 +272,35 @@ async def debug_onboarding(payload: DebugPayload):
     Runs validation and risk analysis on provided data without
     calling the real integration mocks.
     """
-    from app.agent.invariants import (
-        check_account_invariants,
-        check_user_invariants,
-        check_contract_invariants,
-        check_opportunity_invariants,
-        check_invoice_invariants,
-    )
+    from app.agent.invariants import check_all_invariants
+    from app.agent.state_utils import has_blockers, has_warnings, init_state
     from app.llm.risk_analyzer import _rule_based_analyze
 
-    state = {
-        "account": payload.account,
-        "user": payload.user,
-        "clm": payload.contract,
-        "opportunity": payload.opportunity,
-        "invoice": payload.invoice,
-        "violations": {},
-        "warnings": {},
-        "api_errors": [],
-    }
+    state = init_state(
+        account=payload.account,
+        user=payload.user,
+        clm=payload.contract,
+        opportunity=payload.opportunity,
+        invoice=payload.invoice,
+        api_errors=[],
+    )
 
-    check_account_invariants(state)
-    check_user_invariants(state)
-    check_contract_invariants(state)
-    check_opportunity_invariants(state)
-    check_invoice_invariants(state)
+    check_all_invariants(state)
 
     risk_analysis = _rule_based_analyze(state)
     state["risk_analysis"] = risk_analysis
 
-    violations = state.get("violations", {})
-    warnings = state.get("warnings", {})
-    violation_count = sum(len(msgs) for msgs in violations.values())
-    warning_count = sum(len(msgs) for msgs in warnings.values())
-
-    if violation_count > 0:
+    # Only the presence of issues matters here, so stop at the first one
+    if has_blockers(state):
         decision = "BLOCK"
-    elif warning_count > 0:
+    elif has_warnings(state):
         decision = "ESCALATE"
     else:
         decision = "PROCEED"
 
     return {
         "decision": decision,
-        "violations": violations,
-        "warnings": warnings,
+        "violations": state.get("violations", {}),
+        "warnings": state.get("warnings", {}),
         "risk_analysis": risk_analysis,
     }
@@ -7,19 +7,24 @@ This module provides:
 - Authentication and permission checking
 """
 
-from enum import Enum
-from typing import Optional, Dict, Any, List
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Optional, Dict, Any, FrozenSet, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+import itertools
+import os
 import random
+import time
 
 
 # ============================================================================
 # ERROR TYPES
 # ============================================================================
 
-class ErrorCategory(Enum):
-    """Categories of API errors."""
+class ErrorCategory(StrEnum):
+    """Categories of API errors (members are plain strings)."""
     AUTHENTICATION = "authentication"
     AUTHORIZATION = "authorization"
     VALIDATION = "validation"
@@ -36,9 +41,17 @@ class APIError(Exception):
     error_code: str
     message: str
     category: ErrorCategory
-    details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # Errors whose details never vary (the server errors) share one
+    # module-level MappingProxyType instead of building a dict per raise.
+    # A proxy can't be mutated, but it doesn't JSON-encode either, so never
+    # put ``details`` into a payload as-is: copy it with dict() first, as
+    # to_dict() does.
+    details: Mapping[str, Any] = field(default_factory=dict)
+    timestamp: Optional[str] = None
     request_id: Optional[str] = None
+    # Raw creation time; formatted into ``timestamp`` only when the error is
+    # serialized, since most errors are caught and handled without that.
+    created_at: float = field(default_factory=time.time, init=False, repr=False, compare=False)
     
     def __str__(self):
         return f"[{self.error_code}] {self.message} (HTTP {self.status_code})"
@@ -48,9 +61,9 @@ class APIError(Exception):
             "status_code": self.status_code,
             "error_code": self.error_code,
             "message": self.message,
-            "category": self.category.value,
-            "details": self.details,
-            "timestamp": self.timestamp,
+            "category": self.category,
+            "details": dict(self.details),
+            "timestamp": self.timestamp or datetime.fromtimestamp(self.created_at, timezone.utc).isoformat(),
             "request_id": self.request_id,
         }
 
@@ -151,10 +164,20 @@ class SalesforceRateLimitError(SalesforceError):
             details={
                 "limit": limit,
                 "reset_in_seconds": reset_time,
-                "reset_at": (datetime.utcnow() + timedelta(seconds=reset_time)).isoformat(),
             }
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        # reset_at is derived from the creation time only when serialized
+        data = super().to_dict()
+        reset_at = datetime.fromtimestamp(self.created_at + self.details["reset_in_seconds"], timezone.utc)
+        data["details"]["reset_at"] = reset_at.isoformat()
+        return data
+
+
+# Shared by every SalesforceServerError; read-only, see APIError.details
+_SF_SERVER_ERROR_DETAILS = MappingProxyType({"support_url": "https://help.salesforce.com/"})
+
 
 class SalesforceServerError(SalesforceError):
     """Salesforce server error."""
@@ -164,7 +187,7 @@ class SalesforceServerError(SalesforceError):
             error_code="SERVER_ERROR",
             message=message,
             category=ErrorCategory.SERVER_ERROR,
-            details={"support_url": "https://help.salesforce.com/"}
+            details=_SF_SERVER_ERROR_DETAILS,
         )
 
 
@@ -289,6 +312,13 @@ class NetSuiteRateLimitError(NetSuiteError):
         )
 
 
+# Shared by every NetSuiteServerError; read-only, see APIError.details
+_NS_SERVER_ERROR_DETAILS = MappingProxyType({
+    "o:errorCode": "UNEXPECTED_ERROR",
+    "support_url": "https://system.netsuite.com/app/support/supportcenter.nl",
+})
+
+
 class NetSuiteServerError(NetSuiteError):
     """NetSuite server error."""
     def __init__(self, message: str = "An unexpected error has occurred"):
@@ -297,18 +327,30 @@ class NetSuiteServerError(NetSuiteError):
             error_code="UNEXPECTED_ERROR",
             message=message,
             category=ErrorCategory.SERVER_ERROR,
-            details={
-                "o:errorCode": "UNEXPECTED_ERROR",
-                "support_url": "https://system.netsuite.com/app/support/supportcenter.nl"
-            }
+            details=_NS_SERVER_ERROR_DETAILS,
         )
 
 
+# ============================================================================
+# REQUEST IDS
+# ============================================================================
+
+# Request IDs are a per-process random prefix plus a monotonic counter,
+# so no UUID has to be generated for every API call.
+_REQUEST_ID_PREFIX = os.urandom(2).hex()
+_request_ids = itertools.count(1)
+
+
+def next_request_id() -> str:
+    """ID for one simulated API request, unique within the process."""
+    return f"{_REQUEST_ID_PREFIX}{next(_request_ids):04x}"
+
+
 # ============================================================================
 # API CREDENTIALS AND SESSION MANAGEMENT
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class APICredentials:
     """Simulated API credentials."""
     client_id: str
@@ -317,7 +359,13 @@ class APICredentials:
     refresh_token: Optional[str] = None
     token_expiry: Optional[datetime] = None
     is_valid: bool = True
-    permissions: List[str] = field(default_factory=list)
+    permissions: FrozenSet[str] = field(default_factory=frozenset)
+    # "*" grants everything; resolved once so checks are a flag + set lookup
+    _wildcard: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.permissions = frozenset(self.permissions)
+        self._wildcard = "*" in self.permissions
     
     def is_token_expired(self) -> bool:
         if self.token_expiry is None:
@@ -325,7 +373,7 @@ class APICredentials:
         return datetime.utcnow() > self.token_expiry
     
     def has_permission(self, permission: str) -> bool:
-        return permission in self.permissions or "*" in self.permissions
+        return self._wildcard or permission in self.permissions
 
 
 # Default credentials for simulation
@@ -335,7 +383,7 @@ SALESFORCE_CREDENTIALS = APICredentials(
     access_token="00D...mock_token",
     token_expiry=datetime.utcnow() + timedelta(hours=2),
     is_valid=True,
-    permissions=["Account.read", "Account.write", "Opportunity.read", "Contract.read", "User.read"]
+    permissions=frozenset({"Account.read", "Account.write", "Opportunity.read", "Contract.read", "User.read"})
 )
 
 NETSUITE_CREDENTIALS = APICredentials(
@@ -345,7 +393,7 @@ NETSUITE_CREDENTIALS = APICredentials(
     refresh_token="mock_token_secret",
     token_expiry=datetime.utcnow() + timedelta(hours=1),
     is_valid=True,
-    permissions=["invoice.read", "invoice.create", "customer.read"]
+    permissions=frozenset({"invoice.read", "invoice.create", "customer.read"})
 )
 
 
@@ -353,11 +401,70 @@ NETSUITE_CREDENTIALS = APICredentials(
 # ERROR SIMULATION UTILITIES
 # ============================================================================
 
+# Simulated error factories per API, indexed like ErrorSimulator's buckets:
+# (auth, validation, rate_limit, server).
+_SIMULATED_ERRORS = {
+    "salesforce": (
+        SalesforceAuthenticationError,
+        partial(SalesforceValidationError, field="Name", value=None, reason="Simulated validation failure"),
+        partial(SalesforceRateLimitError, limit=100000, reset_time=3600),
+        partial(SalesforceServerError, "Temporary service disruption"),
+    ),
+    "netsuite": (
+        NetSuiteAuthenticationError,
+        partial(NetSuiteValidationError, field="entity", value="INVALID", reason="Simulated validation failure"),
+        partial(NetSuiteRateLimitError, limit=10),
+        partial(NetSuiteServerError, "Temporary service disruption"),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _generic_simulated_errors(api_type: str) -> tuple:
+    """Error factories for CLM and other APIs without dedicated error classes."""
+    return (
+        partial(APIError, status_code=401, error_code="AUTHENTICATION_ERROR",
+                message=f"Simulated {api_type} authentication error",
+                category=ErrorCategory.AUTHENTICATION),
+        partial(APIError, status_code=400, error_code="VALIDATION_ERROR",
+                message=f"Simulated {api_type} validation error",
+                category=ErrorCategory.VALIDATION),
+        partial(APIError, status_code=429, error_code="RATE_LIMIT",
+                message=f"Simulated {api_type} rate limit error",
+                category=ErrorCategory.RATE_LIMIT),
+        partial(APIError, status_code=500, error_code="SERVER_ERROR",
+                message=f"Simulated {api_type} server error",
+                category=ErrorCategory.SERVER_ERROR),
+    )
+
+
+def _no_simulated_error(api_type: str = "salesforce") -> None:
+    """ErrorSimulator.maybe_raise_error while simulation is disabled."""
+
+
+def _error_rate_property(name: str) -> property:
+    """A rate attribute whose setter keeps the cumulative thresholds in sync."""
+    attr = f"_{name}"
+
+    def fget(self) -> float:
+        return getattr(self, attr)
+
+    def fset(self, value: float) -> None:
+        setattr(self, attr, value)
+        self.refresh_thresholds()
+
+    return property(fget, fset)
+
+
 class ErrorSimulator:
     """
     Utility to simulate random API errors for testing.
     
-    Can be configured to inject errors at a certain rate.
+    Can be configured to inject errors at a certain rate. The cumulative
+    thresholds are recomputed whenever a rate is assigned.
+
+    While disabled (the normal state), ``maybe_raise_error`` is swapped for
+    a module-level no-op, so integrations pay only for a plain call.
     """
     
     def __init__(
@@ -368,95 +475,57 @@ class ErrorSimulator:
         server_error_rate: float = 0.0,
         enabled: bool = False
     ):
-        self.auth_error_rate = auth_error_rate
-        self.validation_error_rate = validation_error_rate
-        self.rate_limit_error_rate = rate_limit_error_rate
-        self.server_error_rate = server_error_rate
+        self._auth_error_rate = auth_error_rate
+        self._validation_error_rate = validation_error_rate
+        self._rate_limit_error_rate = rate_limit_error_rate
+        self._server_error_rate = server_error_rate
         self.enabled = enabled
+        self.refresh_thresholds()
+
+    auth_error_rate = _error_rate_property("auth_error_rate")
+    validation_error_rate = _error_rate_property("validation_error_rate")
+    rate_limit_error_rate = _error_rate_property("rate_limit_error_rate")
+    server_error_rate = _error_rate_property("server_error_rate")
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = bool(value)
+        if self._enabled:
+            # Drop the instance override so the real method is found again
+            self.__dict__.pop("maybe_raise_error", None)
+        else:
+            self.maybe_raise_error = _no_simulated_error
+
+    def refresh_thresholds(self) -> None:
+        """Precompute the cumulative bucket thresholds from the current rates."""
+        cumulative = 0.0
+        thresholds = []
+        for rate in (
+            self.auth_error_rate,
+            self.validation_error_rate,
+            self.rate_limit_error_rate,
+            self.server_error_rate,
+        ):
+            cumulative += max(0.0, rate)
+            thresholds.append(cumulative)
+        self._thresholds = tuple(thresholds)
 
     def maybe_raise_error(self, api_type: str = "salesforce") -> None:
-        if not self.enabled:
-            return
-
-        # One roll across buckets
+        # Only reachable while enabled; see the enabled setter.
+        # One roll across buckets: the index is the first bucket whose
+        # cumulative threshold the roll falls under (4 = no error)
         roll = random.random()
-        thresholds = [
-            ("auth", self.auth_error_rate),
-            ("validation", self.validation_error_rate),
-            ("rate_limit", self.rate_limit_error_rate),
-            ("server", self.server_error_rate),
-        ]
-
-        cumulative = 0.0
-        chosen = None
-        for name, rate in thresholds:
-            cumulative += max(0.0, rate)
-            if roll < cumulative:
-                chosen = name
-                break
-        if not chosen:
+        auth, validation, rate_limit, server = self._thresholds
+        bucket = (roll >= auth) + (roll >= validation) + (roll >= rate_limit) + (roll >= server)
+        if bucket == 4:
             return
 
-        # Raise the appropriate error based on api_type
-        if chosen == "auth":
-            if api_type == "salesforce":
-                raise SalesforceAuthenticationError()
-            elif api_type == "netsuite":
-                raise NetSuiteAuthenticationError()
-            else:
-                # For CLM and other types, raise a generic APIError that can be caught
-                raise APIError(
-                    status_code=401,
-                    error_code="AUTHENTICATION_ERROR",
-                    message=f"Simulated {api_type} authentication error",
-                    category=ErrorCategory.AUTHENTICATION
-                )
-
-        if chosen == "server":
-            if api_type == "salesforce":
-                raise SalesforceServerError("Temporary service disruption")
-            elif api_type == "netsuite":
-                raise NetSuiteServerError("Temporary service disruption")
-            else:
-                raise APIError(
-                    status_code=500,
-                    error_code="SERVER_ERROR",
-                    message=f"Simulated {api_type} server error",
-                    category=ErrorCategory.SERVER_ERROR
-                )
-
-        if chosen == "rate_limit":
-            if api_type == "salesforce":
-                raise SalesforceRateLimitError(
-                    limit=100000,
-                    reset_time=3600
-                )
-            elif api_type == "netsuite":
-                raise NetSuiteRateLimitError(limit=10)
-            else:
-                raise APIError(
-                    status_code=429,
-                    error_code="RATE_LIMIT",
-                    message=f"Simulated {api_type} rate limit error",
-                    category=ErrorCategory.RATE_LIMIT
-                )
-
-        if chosen == "validation":
-            if api_type == "salesforce":
-                raise SalesforceValidationError(
-                    field="Name", value=None, reason="Simulated validation failure"
-                )
-            elif api_type == "netsuite":
-                raise NetSuiteValidationError(
-                    field="entity", value="INVALID", reason="Simulated validation failure"
-                )
-            else:
-                raise APIError(
-                    status_code=400,
-                    error_code="VALIDATION_ERROR",
-                    message=f"Simulated {api_type} validation error",
-                    category=ErrorCategory.VALIDATION
-                )
+        factories = _SIMULATED_ERRORS.get(api_type) or _generic_simulated_errors(api_type)
+        raise factories[bucket]()
 
 
 # Global error simulator (disabled by default)
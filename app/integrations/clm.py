@@ -15,8 +15,8 @@ API endpoints simulated:
 - GET /api/v1/contracts/{id}/signatories - Get signatory status
 """
 
-import uuid
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from app.logging.logger import log_event
@@ -25,6 +25,7 @@ from app.integrations.api_errors import (
     APIError,
     ErrorCategory,
     ERROR_SIMULATOR,
+    next_request_id,
 )
 
 
@@ -156,11 +157,11 @@ CLM_CREDENTIALS = APICredentials(
     access_token="clm_bearer_token_mock",
     token_expiry=datetime.utcnow() + timedelta(hours=24),
     is_valid=True,
-    permissions=["contracts.read", "contracts.write", "signatories.read"]
+    permissions=frozenset({"contracts.read", "contracts.write", "signatories.read"})
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CLMConfig:
     """CLM API configuration."""
     base_url: str = "https://api.clm.example/v1"
@@ -523,11 +524,15 @@ MOCK_CLM_DB: Dict[str, Dict[str, Any]] = {
         "documents": [{"id": "DOC-010", "name": "Enterprise Master Agreement", "version": "1.0"}, {"id": "DOC-011", "name": "Data Processing Agreement", "version": "2.0"}],
         "links": {"self": "/api/v1/contracts/CLM-CTR-009"},
     },
-    # Error simulation entries
-    "AUTH-ERROR": {"_simulate_error": "authentication"},
-    "PERM-ERROR": {"_simulate_error": "authorization"},
-    "SERVER-ERROR": {"_simulate_error": "server"},
-    "LOCKED-ERROR": {"_simulate_error": "locked"},
+}
+
+# Error simulation accounts -> the error their lookups raise. Kept apart
+# from MOCK_CLM_DB so real contract lookups need no sentinel check.
+_SIMULATED_ERROR_ACCOUNTS: Dict[str, str] = {
+    "AUTH-ERROR": "authentication",
+    "PERM-ERROR": "authorization",
+    "SERVER-ERROR": "server",
+    "LOCKED-ERROR": "locked",
 }
 
 
@@ -535,6 +540,18 @@ MOCK_CLM_DB: Dict[str, Dict[str, Any]] = {
 # CLM API CLIENT
 # ============================================================================
 
+# (epoch second, ISO string) for the last second a timestamp was formatted
+_ISO_CACHE = [0, ""]
+
+
+def _utc_iso_seconds() -> str:
+    """Current UTC time as ISO 8601 at one-second resolution, formatted once per second."""
+    sec = int(time.time())
+    if sec != _ISO_CACHE[0]:
+        _ISO_CACHE[:] = [sec, datetime.fromtimestamp(sec, timezone.utc).isoformat()]
+    return _ISO_CACHE[1]
+
+
 class CLMClient:
     """
     Mock CLM REST API client with realistic error handling.
@@ -577,7 +594,7 @@ class CLMClient:
     ) -> None:
         """Make authenticated request with validation."""
         self._request_count += 1
-        request_id = str(uuid.uuid4())[:8]
+        request_id = next_request_id()
         
         log_event(
             "clm.api.request",
@@ -596,12 +613,13 @@ class CLMClient:
         Retrieve contract by ID.
         """
         # Check for error simulation
-        contract = MOCK_CLM_DB.get(contract_id)
-        if contract and contract.get("_simulate_error"):
-            self._raise_simulated_error(contract["_simulate_error"], contract_id)
+        simulated_error = _SIMULATED_ERROR_ACCOUNTS.get(contract_id)
+        if simulated_error:
+            self._raise_simulated_error(simulated_error, contract_id)
         
         self._make_request("GET", f"/contracts/{contract_id}")
         
+        contract = MOCK_CLM_DB.get(contract_id)
         if not contract:
             raise CLMNotFoundError("Contract", contract_id)
         
@@ -621,13 +639,12 @@ class CLMClient:
         """
         self._make_request("GET", f"/contracts?external_id={account_id}")
         
-        contract = MOCK_CLM_DB.get(account_id)
-        
         # Check for error simulation
-        if contract and contract.get("_simulate_error"):
-            self._raise_simulated_error(contract["_simulate_error"], account_id)
+        simulated_error = _SIMULATED_ERROR_ACCOUNTS.get(account_id)
+        if simulated_error:
+            self._raise_simulated_error(simulated_error, account_id)
         
-        return contract
+        return MOCK_CLM_DB.get(account_id)
     
     def get_contract_by_sf_id(self, sf_contract_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -638,8 +655,6 @@ class CLMClient:
         self._make_request("GET", f"/contracts?salesforce_contract_id={sf_contract_id}")
 
         for contract in MOCK_CLM_DB.values():
-            if contract.get("_simulate_error"):
-                continue
             if contract.get("salesforce_contract_id") == sf_contract_id:
                 return contract
 
@@ -676,7 +691,7 @@ class CLMClient:
         return {
             "success": True,
             "message": "Reminder sent successfully",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_iso_seconds(),
         }
     
     def _raise_simulated_error(self, error_type: str, contract_id: str) -> None:
@@ -710,6 +725,37 @@ def get_client() -> CLMClient:
 # HIGH-LEVEL FUNCTIONS (Used by the agent)
 # ============================================================================
 
+# CLM error type -> (log event, agent-facing status) for get_contract
+_CLM_ERROR_TABLE = {
+    CLMAuthenticationError: ("clm.api.auth_error", "AUTH_ERROR"),
+    CLMAuthorizationError: ("clm.api.permission_error", "PERMISSION_ERROR"),
+    CLMRateLimitError: ("clm.api.rate_limit_error", "RATE_LIMIT_ERROR"),
+    CLMValidationError: ("clm.api.validation_error", "VALIDATION_ERROR"),
+    CLMServerError: ("clm.api.server_error", "SERVER_ERROR"),
+}
+
+# Agent-facing status for simulated errors, by category
+_CATEGORY_STATUS = {
+    ErrorCategory.AUTHENTICATION: "AUTH_ERROR",
+    ErrorCategory.AUTHORIZATION: "PERMISSION_ERROR",
+    ErrorCategory.VALIDATION: "VALIDATION_ERROR",
+    ErrorCategory.RATE_LIMIT: "RATE_LIMIT_ERROR",
+    ErrorCategory.SERVER_ERROR: "SERVER_ERROR",
+}
+
+
+def _contract_error_response(status: str, e: APIError) -> Dict[str, Any]:
+    """Agent-facing payload for a failed CLM contract lookup."""
+    return {
+        "contract_id": None,
+        "status": status,
+        "error": str(e),
+        "error_code": e.error_code,
+        "http_status": e.status_code,
+        "system": "CLM",
+    }
+
+
 def get_contract(account_id: str) -> Dict[str, Any]:
     """
     Fetch contract data for an account.
@@ -728,92 +774,21 @@ def get_contract(account_id: str) -> Dict[str, Any]:
                 "error": f"No contract found for account {account_id}"
             }
         
-        return _transform_contract_for_agent(contract)
-    
-    except CLMAuthenticationError as e:
-        log_event("clm.api.auth_error", error=str(e), account_id=account_id)
-        return {
-            "contract_id": None,
-            "status": "AUTH_ERROR",
-            "error": str(e),
-            "error_code": e.error_code,
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
-    
-    except CLMAuthorizationError as e:
-        log_event("clm.api.permission_error", error=str(e), account_id=account_id)
-        return {
-            "contract_id": None,
-            "status": "PERMISSION_ERROR",
-            "error": str(e),
-            "error_code": e.error_code,
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
-    
-    except CLMRateLimitError as e:
-        log_event("clm.api.rate_limit_error", error=str(e), account_id=account_id)
-        return {
-            "contract_id": None,
-            "status": "RATE_LIMIT_ERROR",
-            "error": str(e),
-            "error_code": e.error_code,
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
-    
-    except CLMValidationError as e:
-        log_event("clm.api.validation_error", error=str(e), account_id=account_id)
-        return {
-            "contract_id": None,
-            "status": "VALIDATION_ERROR",
-            "error": str(e),
-            "error_code": e.error_code,
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
-    
-    except CLMServerError as e:
-        log_event("clm.api.server_error", error=str(e), account_id=account_id)
-        return {
-            "contract_id": None,
-            "status": "SERVER_ERROR",
-            "error": str(e),
-            "error_code": getattr(e, 'error_code', 'INTERNAL_ERROR'),
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
-    
-    except CLMError as e:
-        log_event("clm.api.error", error=str(e), account_id=account_id)
-        return {
-            "contract_id": None,
-            "status": "API_ERROR",
-            "error": str(e),
-            "error_code": getattr(e, 'error_code', 'CLM_ERROR'),
-            "http_status": getattr(e, 'status_code', 500),
-            "system": "CLM",
-        }
+        return _contract_view(contract)
     
     except APIError as e:
-        # Catch simulated errors from ERROR_SIMULATOR
-        log_event("clm.api.simulated_error", error=str(e), account_id=account_id, category=str(e.category))
-        status_map = {
-            ErrorCategory.AUTHENTICATION: "AUTH_ERROR",
-            ErrorCategory.AUTHORIZATION: "PERMISSION_ERROR",
-            ErrorCategory.VALIDATION: "VALIDATION_ERROR",
-            ErrorCategory.RATE_LIMIT: "RATE_LIMIT_ERROR",
-            ErrorCategory.SERVER_ERROR: "SERVER_ERROR",
-        }
-        return {
-            "contract_id": None,
-            "status": status_map.get(e.category, "API_ERROR"),
-            "error": str(e),
-            "error_code": e.error_code,
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
+        known = _CLM_ERROR_TABLE.get(type(e))
+        if known is not None:
+            log_key, status = known
+            log_event(log_key, error=str(e), account_id=account_id)
+        elif isinstance(e, CLMError):
+            status = "API_ERROR"
+            log_event("clm.api.error", error=str(e), account_id=account_id)
+        else:
+            # Simulated errors from ERROR_SIMULATOR are plain APIErrors
+            status = _CATEGORY_STATUS.get(e.category, "API_ERROR")
+            log_event("clm.api.simulated_error", error=str(e), account_id=account_id, category=str(e.category))
+        return _contract_error_response(status, e)
 
 
 def get_contract_by_sf_contract_id(sf_contract_id: str) -> Dict[str, Any]:
@@ -835,29 +810,39 @@ def get_contract_by_sf_contract_id(sf_contract_id: str) -> Dict[str, Any]:
                 "error": f"No CLM contract linked to Salesforce Contract {sf_contract_id}"
             }
 
-        return _transform_contract_for_agent(contract)
+        return _contract_view(contract)
 
     except CLMAuthenticationError as e:
         log_event("clm.api.auth_error", error=str(e), sf_contract_id=sf_contract_id)
-        return {
-            "contract_id": None,
-            "status": "AUTH_ERROR",
-            "error": str(e),
-            "error_code": e.error_code,
-            "http_status": e.status_code,
-            "system": "CLM",
-        }
+        return _contract_error_response("AUTH_ERROR", e)
 
     except (CLMError, APIError) as e:
         log_event("clm.api.error", error=str(e), sf_contract_id=sf_contract_id)
-        return {
-            "contract_id": None,
-            "status": "API_ERROR",
-            "error": str(e),
-            "error_code": getattr(e, 'error_code', 'CLM_ERROR'),
-            "http_status": getattr(e, 'status_code', 500),
-            "system": "CLM",
-        }
+        return _contract_error_response("API_ERROR", e)
+
+
+# contract_id -> agent view of that contract. The mock contracts only change
+# through app.integrations.resolution, which calls invalidate_contract_views().
+_CONTRACT_VIEWS: Dict[str, Dict[str, Any]] = {}
+
+
+def invalidate_contract_views() -> None:
+    """Drop cached agent views after MOCK_CLM_DB has been modified."""
+    _CONTRACT_VIEWS.clear()
+
+
+def _contract_view(contract: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the (shared, read-only by convention) agent view of a contract,
+    transforming it only the first time it is requested.
+    """
+    contract_id = contract.get("contract_id")
+    view = _CONTRACT_VIEWS.get(contract_id)
+    if view is None:
+        view = _transform_contract_for_agent(contract)
+        if contract_id is not None:
+            _CONTRACT_VIEWS[contract_id] = view
+    return view
 
 
 def _transform_contract_for_agent(contract: Dict[str, Any]) -> Dict[str, Any]:
@@ -7,6 +7,7 @@ Uses the European Central Bank's published rates — no API key required.
 API docs: https://frankfurter.dev
 """
 
+import threading
 import httpx
 from typing import Dict, Any, Optional
 
@@ -16,6 +17,44 @@ from app.logging.logger import log_event
 FRANKFURTER_BASE_URL = "https://api.frankfurter.dev/v1"
 
 
+# ============================================================================
+# SHARED HTTP CLIENT
+# ============================================================================
+
+_http_client: Optional[httpx.Client] = None
+# convert_currency runs in worker threads, so creation and close are locked
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Get or create the pooled HTTP client for the Frankfurter API.
+
+    Reusing one client keeps TCP/TLS connections alive across conversions
+    instead of paying a fresh handshake on every call.
+    """
+    global _http_client
+    client = _http_client
+    if client is None:
+        with _http_client_lock:
+            client = _http_client
+            if client is None:
+                client = _http_client = httpx.Client(
+                    base_url=FRANKFURTER_BASE_URL,
+                    timeout=10,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                )
+    return client
+
+
+def close_http_client() -> None:
+    """Close the pooled Frankfurter client (called on app shutdown)."""
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
 def convert_currency(
     amount: float,
     from_currency: str,
@@ -63,10 +102,9 @@ def convert_currency(
     try:
         # Use historical endpoint if date provided, otherwise latest
         endpoint = date if date else "latest"
-        resp = httpx.get(
-            f"{FRANKFURTER_BASE_URL}/{endpoint}",
+        resp = get_http_client().get(
+            f"/{endpoint}",
             params={"from": from_currency, "to": to_currency, "amount": amount},
-            timeout=10,
         )
         resp.raise_for_status()
         data = resp.json()
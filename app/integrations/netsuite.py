@@ -13,7 +13,6 @@ In production, this would use:
 - Base URL: https://{account_id}.suitetalk.api.netsuite.com/services/rest/record/v1
 """
 
-import uuid
 from datetime import date, datetime, timedelta
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
@@ -35,6 +34,7 @@ from app.integrations.api_errors import (
     validate_netsuite_credentials,
     check_netsuite_permission,
     ERROR_SIMULATOR,
+    next_request_id,
 )
 
 
@@ -601,7 +601,7 @@ class NetSuiteClient:
         Make a request to NetSuite REST API with full validation.
         """
         self._request_count += 1
-        request_id = str(uuid.uuid4())[:8]
+        request_id = next_request_id()
         
         log_event(
             "netsuite.api.request",
@@ -847,7 +847,7 @@ def get_invoice(account_id: str) -> Dict[str, Any]:
             "status": "AUTH_ERROR",
             "error": str(e),
             "error_code": e.error_code,
-            "error_details": e.details,
+            "error_details": dict(e.details),
         }
     
     except NetSuiteAuthorizationError as e:
@@ -857,7 +857,7 @@ def get_invoice(account_id: str) -> Dict[str, Any]:
             "status": "PERMISSION_ERROR",
             "error": str(e),
             "error_code": e.error_code,
-            "error_details": e.details,
+            "error_details": dict(e.details),
         }
     
     except NetSuiteValidationError as e:
@@ -867,7 +867,7 @@ def get_invoice(account_id: str) -> Dict[str, Any]:
             "status": "VALIDATION_ERROR",
             "error": str(e),
             "error_code": e.error_code,
-            "error_details": e.details,
+            "error_details": dict(e.details),
         }
     
     except NetSuiteNotFoundError as e:
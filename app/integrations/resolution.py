@@ -35,6 +35,7 @@ def reset_resolution_state() -> None:
 
     clm.MOCK_CLM_DB.clear()
     clm.MOCK_CLM_DB.update(deepcopy(_ORIGINAL_CLM_DB))
+    clm.invalidate_contract_views()
 
     netsuite.MOCK_INVOICES_DB.clear()
     netsuite.MOCK_INVOICES_DB.update(deepcopy(_ORIGINAL_NETSUITE_DB))
@@ -162,11 +163,13 @@ def _resolve_salesforce_contract(account_id: str, changes: List[str]) -> str:
     contract["AccountId"] = account["Id"]
     contract["OwnerId"] = "0058Z000001OWNER"
     contract["Status"] = "Activated"
-    contract["StartDate"] = contract.get("StartDate") or datetime.utcnow().strftime("%Y-%m-%d")
-    contract["EndDate"] = contract.get("EndDate") or (datetime.utcnow() + timedelta(days=365)).strftime("%Y-%m-%d")
-    contract["ActivatedDate"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000+0000")
-    contract["CustomerSignedDate"] = contract.get("CustomerSignedDate") or datetime.utcnow().strftime("%Y-%m-%d")
-    contract["CompanySignedDate"] = contract.get("CompanySignedDate") or datetime.utcnow().strftime("%Y-%m-%d")
+    now = datetime.utcnow()
+    today = now.strftime("%Y-%m-%d")
+    contract["StartDate"] = contract.get("StartDate") or today
+    contract["EndDate"] = contract.get("EndDate") or (now + timedelta(days=365)).strftime("%Y-%m-%d")
+    contract["ActivatedDate"] = now.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+    contract["CustomerSignedDate"] = contract.get("CustomerSignedDate") or today
+    contract["CompanySignedDate"] = contract.get("CompanySignedDate") or today
 
     if opportunity and opportunity.get("ContractId") != contract["Id"]:
         opportunity["ContractId"] = contract["Id"]
@@ -186,7 +189,8 @@ def _resolve_clm_contract(account_id: str, sf_contract_id: str, changes: List[st
         clm.MOCK_CLM_DB[account_id] = contract
         changes.append("Created missing CLM contract")
 
-    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    utc_now = datetime.utcnow()
+    now = utc_now.strftime("%Y-%m-%dT%H:%M:%SZ")
     contract["salesforce_contract_id"] = sf_contract_id
     contract["status"] = "EXECUTED"
     contract["status_details"] = {
@@ -194,8 +198,8 @@ def _resolve_clm_contract(account_id: str, sf_contract_id: str, changes: List[st
         "label": "Fully Executed",
         "description": "All signatures collected and countersigned",
     }
-    contract["effective_date"] = contract.get("effective_date") or datetime.utcnow().strftime("%Y-%m-%d")
-    contract["expiry_date"] = contract.get("expiry_date") or (datetime.utcnow() + timedelta(days=365)).strftime("%Y-%m-%d")
+    contract["effective_date"] = contract.get("effective_date") or utc_now.strftime("%Y-%m-%d")
+    contract["expiry_date"] = contract.get("expiry_date") or (utc_now + timedelta(days=365)).strftime("%Y-%m-%d")
     contract["signed_date"] = now
 
     signatories = contract.get("signatories") or []
@@ -224,6 +228,7 @@ def _resolve_clm_contract(account_id: str, sf_contract_id: str, changes: List[st
         signatory.pop("reminder_sent", None)
         signatory.pop("reminder_date", None)
 
+    clm.invalidate_contract_views()
     changes.append("Marked CLM contract as fully executed")
     return contract["contract_id"]
 
@@ -244,7 +249,8 @@ def _resolve_invoice(account_id: str, clm_contract_id: str, changes: List[str])
 
     invoice = netsuite.MOCK_INVOICES_DB[invoice_key]
     total = float(opportunity.get("Amount") or invoice.get("total") or 150000.0)
-    today = datetime.utcnow().strftime("%Y-%m-%d")
+    now = datetime.utcnow()
+    today = now.strftime("%Y-%m-%d")
 
     invoice["externalId"] = f"{account_id}-INV"
     invoice["clmContractRef"] = clm_contract_id
@@ -259,9 +265,9 @@ def _resolve_invoice(account_id: str, clm_contract_id: str, changes: List[str])
     invoice["amountPaid"] = total
     invoice["amountRemaining"] = 0.0
     invoice["tranDate"] = today
-    invoice["dueDate"] = (datetime.utcnow() + timedelta(days=30)).strftime("%Y-%m-%d")
+    invoice["dueDate"] = (now + timedelta(days=30)).strftime("%Y-%m-%d")
     invoice["status"] = {"id": "B", "refName": "Paid In Full"}
-    invoice["lastModifiedDate"] = datetime.utcnow().isoformat()
+    invoice["lastModifiedDate"] = now.isoformat()
     netsuite.ACCOUNT_TO_INVOICE_MAP[account_id] = invoice_key
 
     changes.append("Aligned and marked NetSuite invoice as paid in full")
@@ -35,6 +35,7 @@ from app.integrations.api_errors import (
     validate_salesforce_credentials,
     check_salesforce_permission,
     ERROR_SIMULATOR,
+    next_request_id,
 )
 
 
@@ -587,7 +588,7 @@ class SalesforceClient:
     ) -> Dict[str, Any]:
         """Make a request to Salesforce API with full validation."""
         self._request_count += 1
-        request_id = str(uuid.uuid4())[:8]
+        request_id = next_request_id()
         
         log_event(
             "salesforce.api.request",
@@ -876,7 +877,7 @@ def get_account(account_id: str) -> Optional[Dict[str, Any]]:
         return {
             "status": "API_ERROR",
             "system": "salesforce",
-            "error_type": str(e.category.value) if e.category else "unknown",
+            "error_type": str(e.category) if e.category else "unknown",
             "error_code": e.error_code,
             "message": str(e),
             "http_status": e.status_code,
@@ -910,7 +911,7 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
         return {
             "status": "API_ERROR",
             "system": "salesforce",
-            "error_type": str(e.category.value) if e.category else "unknown",
+            "error_type": str(e.category) if e.category else "unknown",
             "error_code": e.error_code,
             "message": str(e),
             "http_status": e.status_code,
@@ -7,7 +7,27 @@ the debug endpoint and report generation when the agent is not involved.
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional
+
+
+class _ApiErrorAction(NamedTuple):
+    """Recommended remediation for an API error type."""
+    action: str
+    owner: str
+
+
+# Recommended remediation per API error type, built once at import and
+# read-only. Error types without an entry fall back to _DEFAULT_API_ERROR_ACTION.
+_API_ERROR_ACTIONS: Mapping[str, _ApiErrorAction] = MappingProxyType({
+    "authentication": _ApiErrorAction("Re-authenticate with {system}", "IT/DevOps"),
+    "authorization": _ApiErrorAction("Check {system} API permissions", "IT/DevOps"),
+})
+_DEFAULT_API_ERROR_ACTION = _ApiErrorAction("Investigate {system} API error and retry", "IT/DevOps")
+
+def _issue_counts(violations: dict, warnings: dict) -> tuple:
+    """Return (violation_count, warning_count) across all domains."""
+    return sum(map(len, violations.values())), sum(map(len, warnings.values()))
 
 
 def _rule_based_analyze(state: dict) -> dict:
@@ -21,8 +41,7 @@ def _rule_based_analyze(state: dict) -> dict:
     warnings = state.get("warnings", {})
     api_errors = state.get("api_errors", [])
 
-    violation_count = sum(len(msgs) for msgs in violations.values())
-    warning_count = sum(len(msgs) for msgs in warnings.values())
+    violation_count, warning_count = _issue_counts(violations, warnings)
     api_error_count = len(api_errors)
 
     # Determine risk level
@@ -41,12 +60,12 @@ def _rule_based_analyze(state: dict) -> dict:
     risks = []
 
     for error in api_errors:
-        system = error.get("system", "api")
+        system = error.get("system", "api").title()
         error_type = error.get("error_type", "unknown")
         message = error.get("message", "API error occurred")
         risks.append({
-            "issue": f"{system.title()} API {error_type.replace('_', ' ').title()} Error: {message}",
-            "impact": f"Cannot fetch required data from {system.title()} - onboarding blocked",
+            "issue": f"{system} API {error_type.replace('_', ' ').title()} Error: {message}",
+            "impact": f"Cannot fetch required data from {system} - onboarding blocked",
             "urgency": "critical"
         })
 
@@ -85,26 +104,14 @@ def _rule_based_analyze(state: dict) -> dict:
     priority = 1
 
     for error in api_errors:
-        system = error.get("system", "api")
-        error_type = error.get("error_type", "unknown")
-        if error_type == "authentication":
-            recommended_actions.append({
-                "action": f"Re-authenticate with {system.title()}",
-                "owner": "IT/DevOps",
-                "priority": priority
-            })
-        elif error_type == "authorization":
-            recommended_actions.append({
-                "action": f"Check {system.title()} API permissions",
-                "owner": "IT/DevOps",
-                "priority": priority
-            })
-        else:
-            recommended_actions.append({
-                "action": f"Investigate {system.title()} API error and retry",
-                "owner": "IT/DevOps",
-                "priority": priority
-            })
+        remediation = _API_ERROR_ACTIONS.get(
+            error.get("error_type", "unknown"), _DEFAULT_API_ERROR_ACTION
+        )
+        recommended_actions.append({
+            "action": remediation.action.format(system=error.get("system", "api").title()),
+            "owner": remediation.owner,
+            "priority": priority
+        })
         priority += 1
 
     if "account" in violations:
@@ -162,8 +169,7 @@ def _rule_based_analyze(state: dict) -> dict:
 
 def _estimate_resolution_time(violations: dict, warnings: dict, api_errors: list = None) -> str:
     api_errors = api_errors or []
-    violation_count = sum(len(msgs) for msgs in violations.values())
-    warning_count = sum(len(msgs) for msgs in warnings.values())
+    violation_count, warning_count = _issue_counts(violations, warnings)
     api_error_count = len(api_errors)
 
     if api_error_count > 0:
@@ -195,8 +201,7 @@ def _fallback_summary(state: dict) -> str:
     warnings = state.get("warnings", {})
     api_errors = state.get("api_errors", [])
 
-    violation_count = sum(len(msgs) for msgs in violations.values())
-    warning_count = sum(len(msgs) for msgs in warnings.values())
+    violation_count, warning_count = _issue_counts(violations, warnings)
     api_error_count = len(api_errors)
 
     lines = [
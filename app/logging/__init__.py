@@ -1,3 +1,3 @@
-from .logger import log_event, log_error, log_state_transition
+from .logger import log_event, log_error, log_state_transition, is_enabled
 
-__all__ = ["log_event", "log_error", "log_state_transition"]
+__all__ = ["log_event", "log_error", "log_state_transition", "is_enabled"]
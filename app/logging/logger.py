@@ -5,10 +5,18 @@ Provides audit trail and observability.
 
 import os
 import json
+import atexit
 import logging
+import logging.handlers
+import queue
 from datetime import datetime, timezone
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 # ----------------------------
 # Log directory setup
 # ----------------------------
@@ -40,11 +48,23 @@ file_handler = logging.FileHandler(LOG_FILE)
 file_handler.setFormatter(formatter)
 file_handler.setLevel(logging.INFO)
 
-# Always attach our handlers. Clear any that tracing backends may have injected
-# so we have exactly the two we expect.
+# The request path only enqueues records; a listener thread does the console
+# and file writes. Clear any handlers tracing backends may have injected so
+# the queue handler is the only one.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, console_handler, file_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # drain queued records on shutdown
+
 logger.handlers.clear()
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+
+def is_enabled(level: int = logging.INFO) -> bool:
+    """Return True if the agent logger would emit a record at this level."""
+    return logger.isEnabledFor(level)
 
 
 def now_iso() -> str:
@@ -52,6 +72,15 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def dumps(payload: Any) -> str:
+    """Serialize a payload to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            payload, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(payload, default=str)
+
+
 def log_event(event: str, **fields: Any) -> None:
     """
     Write a structured JSON log entry.
@@ -60,12 +89,14 @@ def log_event(event: str, **fields: Any) -> None:
         event: Event name (e.g., "webhook.received", "decision.made")
         **fields: Additional fields to include in the log
     """
+    if not is_enabled(logging.INFO):
+        return
     payload = {
         "ts": now_iso(),
         "event": event,
         **fields,
     }
-    logger.info(json.dumps(payload, default=str))
+    logger.info(dumps(payload))
 
 
 def log_error(event: str, error: Exception, **fields: Any) -> None:
@@ -77,7 +108,7 @@ def log_error(event: str, error: Exception, **fields: Any) -> None:
         "error_type": type(error).__name__,
         **fields,
     }
-    logger.error(json.dumps(payload, default=str))
+    logger.error(dumps(payload))
 
 
 def log_state_transition(
@@ -88,6 +119,8 @@ def log_state_transition(
     **fields: Any
 ) -> None:
     """Log a state machine transition."""
+    if not is_enabled(logging.INFO):
+        return
     log_event(
         "state.transition",
         from_stage=from_stage,
@@ -45,31 +45,20 @@ def validate_all(
             "warnings": {"domain": ["non-blocking concern 1", ...]}
         }
     """
-    from app.agent.invariants import (
-        check_account_invariants,
-        check_user_invariants,
-        check_opportunity_invariants,
-        check_contract_invariants,
-        check_invoice_invariants,
-    )
+    from app.agent.invariants import check_all_invariants
+    from app.agent.state_utils import init_state
 
     # Build a minimal state dict for the invariant checkers
-    state = {
-        "account": account,
-        "user": user,
-        "opportunity": opportunity,
-        "contract": contract,
-        "invoice": invoice,
-        "clm": clm,
-        "violations": {},
-        "warnings": {},
-    }
+    state = init_state(
+        account=account,
+        user=user,
+        opportunity=opportunity,
+        contract=contract,
+        invoice=invoice,
+        clm=clm,
+    )
 
-    check_account_invariants(state)
-    check_user_invariants(state)
-    check_opportunity_invariants(state)
-    check_contract_invariants(state)
-    check_invoice_invariants(state)
+    check_all_invariants(state)
 
     return {
         "violations": state.get("violations", {}),
@@ -40,6 +40,7 @@ class OnboardingResponse(BaseModel):
     recommended_actions: List[Any] = Field(default_factory=list)  # Can be strings or dicts from LLM
     provisioning: Optional[Dict[str, Any]] = None
     generated_reports: Optional[Dict[str, str]] = None  # paths to generated report files
+    reports_status_url: Optional[str] = None  # set when report generation was deferred
 
 
 class DebugPayload(BaseModel):
@@ -3,7 +3,8 @@ Mock notification service for Slack and Email.
 In production, this would integrate with Slack API and SendGrid/SES.
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional
 from app.logging.logger import log_event
 
@@ -11,6 +12,12 @@ from app.logging.logger import log_event
 _SENT_NOTIFICATIONS = []
 
 
+def _sent_stamp() -> tuple[float, str]:
+    """Return the send time as epoch seconds and as an ISO-8601 UTC string."""
+    now = time.time()
+    return now, datetime.fromtimestamp(now, timezone.utc).isoformat(timespec="milliseconds")
+
+
 def send_slack_message(
     channel: str,
     message: str,
@@ -25,6 +32,7 @@ def send_slack_message(
     
     In production, this would use the Slack Web API.
     """
+    sent_ts, sent_at = _sent_stamp()
     notification = {
         "type": "slack",
         "channel": channel,
@@ -33,7 +41,7 @@ def send_slack_message(
         "blocks": blocks,
         "account_id": account_id,
         "correlation_id": correlation_id,
-        "sent_at": datetime.utcnow().isoformat(),
+        "sent_at": sent_at,
         "status": "sent",
     }
     
@@ -50,7 +58,7 @@ def send_slack_message(
     return {
         "ok": True,
         "channel": channel,
-        "ts": f"mock-{datetime.utcnow().timestamp()}",
+        "ts": f"mock-{sent_ts}",
         "message": notification,
     }
 
@@ -70,6 +78,7 @@ def send_email(
     
     In production, this would use SendGrid, AWS SES, etc.
     """
+    sent_ts, sent_at = _sent_stamp()
     notification = {
         "type": "email",
         "to": to,
@@ -79,7 +88,7 @@ def send_email(
         "template": template,
         "account_id": account_id,
         "correlation_id": correlation_id,
-        "sent_at": datetime.utcnow().isoformat(),
+        "sent_at": sent_at,
         "status": "sent",
     }
     
@@ -95,7 +104,7 @@ def send_email(
     # Mock response
     return {
         "ok": True,
-        "message_id": f"mock-email-{datetime.utcnow().timestamp()}",
+        "message_id": f"mock-email-{sent_ts}",
         "notification": notification,
     }
 
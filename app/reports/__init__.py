@@ -10,6 +10,8 @@ from .generator import (
     save_email_html,
     save_report_markdown,
     save_audit_json,
+    reports_version,
+    mark_reports_changed,
     REPORTS_DIR,
 )
 
@@ -25,5 +27,7 @@ __all__ = [
     "save_email_html",
     "save_report_markdown",
     "save_audit_json",
+    "reports_version",
+    "mark_reports_changed",
     "REPORTS_DIR",
 ]
\ No newline at end of file
@@ -20,11 +20,39 @@ _project_root = _current_file.parent.parent.parent
 REPORTS_DIR = str(_project_root / "reports_output")
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
+# Bumped on every write to (or cleanup of) REPORTS_DIR, so a cached listing
+# can tell it is stale even when the directory mtime has not visibly changed
+# (its resolution is coarse on some filesystems).
+_reports_version = 0
+
+
+def reports_version() -> int:
+    """Current value of the REPORTS_DIR change counter."""
+    return _reports_version
+
+
+def mark_reports_changed() -> None:
+    """Invalidate cached REPORTS_DIR listings after adding or removing files."""
+    global _reports_version
+    _reports_version += 1
+
 
 # ============================================================================
 # HTML EMAIL TEMPLATES
 # ============================================================================
 
+def _html_escape(s: Any) -> str:
+    """Escape a value for safe interpolation into HTML text or attributes."""
+    s = "" if s is None else str(s)
+    return (
+        s.replace("&", "&amp;")
+         .replace("<", "&lt;")
+         .replace(">", "&gt;")
+         .replace('"', "&quot;")
+         .replace("'", "&#39;")
+    )
+
+
 def generate_email_html(
     to: str,
     subject: str,
@@ -391,49 +419,39 @@ def generate_api_error_notification_email(
 ) -> str:
     """Generate HTML email for API integration error notification."""
 
-    def html_escape(s: Any) -> str:
-        s = "" if s is None else str(s)
-        return (
-            s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&#39;")
-        )
-
     errors_html = ""
     for i, error in enumerate(api_errors, 1):
-        system = html_escape(error.get("system", "unknown").upper())
-        error_type = html_escape(error.get("error_type", "unknown").replace("_", " ").title())
-        error_code = html_escape(error.get("error_code", "UNKNOWN"))
-        http_status = html_escape(error.get("http_status", 0))
+        system = _html_escape(error.get("system", "unknown").upper())
+        error_type = _html_escape(error.get("error_type", "unknown").replace("_", " ").title())
+        error_code = _html_escape(error.get("error_code", "UNKNOWN"))
+        http_status = _html_escape(error.get("http_status", 0))
 
         # IMPORTANT: show RAW message + run context (Fix B)
-        raw_message = html_escape(error.get("message", "No message"))
-        description = html_escape(error.get("description", ""))  # keep as secondary “meaning”
-        resolution = html_escape(error.get("resolution", "Contact the integration administrator."))
-        owner = html_escape(error.get("owner", "Support Team"))
+        raw_message = _html_escape(error.get("message", "No message"))
+        description = _html_escape(error.get("description", ""))  # keep as secondary “meaning”
+        resolution = _html_escape(error.get("resolution", "Contact the integration administrator."))
+        owner = _html_escape(error.get("owner", "Support Team"))
 
-        error_id = html_escape(error.get("error_id", ""))
-        stage = html_escape(error.get("stage", ""))
-        acc = html_escape(error.get("account_id", account_id))
+        error_id = _html_escape(error.get("error_id", ""))
+        stage = _html_escape(error.get("stage", ""))
+        acc = _html_escape(error.get("account_id", account_id))
 
         details = error.get("details", {}) or {}
-        op = html_escape(details.get("operation", "unknown"))
-        req_id = html_escape(details.get("request_id", ""))
+        op = _html_escape(details.get("operation", "unknown"))
+        req_id = _html_escape(details.get("request_id", ""))
         entity_ctx = error.get("entity_context") or details.get("entity_context") or {}
 
         try:
-            details_pretty = html_escape(json.dumps(details, indent=2, sort_keys=True))
+            details_pretty = _html_escape(json.dumps(details, indent=2, sort_keys=True))
         except Exception:
-            details_pretty = html_escape(str(details))
+            details_pretty = _html_escape(str(details))
 
         # Render entity context as a compact line
         entity_bits = []
         if isinstance(entity_ctx, dict):
             for k, v in entity_ctx.items():
                 if v:
-                    entity_bits.append(f"{k}={html_escape(v)}")
+                    entity_bits.append(f"{k}={_html_escape(v)}")
         entity_line = ", ".join(entity_bits) if entity_bits else "N/A"
 
         errors_html += f"""
@@ -444,7 +462,7 @@ def generate_api_error_notification_email(
                 <tr><td style="padding: 4px 0; width: 140px;"><strong>Error ID:</strong></td><td><code style="background:#f4f4f4;padding:2px 6px;border-radius:3px;">{error_id}</code></td></tr>
                 <tr><td style="padding: 4px 0;"><strong>Stage:</strong></td><td>{stage}</td></tr>
                 <tr><td style="padding: 4px 0;"><strong>Account:</strong></td><td>{acc}</td></tr>
-                <tr><td style="padding: 4px 0;"><strong>Correlation ID:</strong></td><td><code style="background:#f4f4f4;padding:2px 6px;border-radius:3px;">{html_escape(correlation_id)}</code></td></tr>
+                <tr><td style="padding: 4px 0;"><strong>Correlation ID:</strong></td><td><code style="background:#f4f4f4;padding:2px 6px;border-radius:3px;">{_html_escape(correlation_id)}</code></td></tr>
                 <tr><td style="padding: 4px 0;"><strong>Operation:</strong></td><td>{op}</td></tr>
                 <tr><td style="padding: 4px 0;"><strong>Request ID:</strong></td><td>{req_id or "N/A"}</td></tr>
                 <tr><td style="padding: 4px 0;"><strong>Entities:</strong></td><td>{entity_line}</td></tr>
@@ -482,11 +500,11 @@ def generate_api_error_notification_email(
             "content": f"""
                 <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 4px; padding: 15px; margin-bottom: 15px;">
                     <p style="margin: 0; color: #721c24;">
-                        The onboarding process for <strong>{html_escape(account_name)}</strong> has been blocked due to API integration errors.
+                        The onboarding process for <strong>{_html_escape(account_name)}</strong> has been blocked due to API integration errors.
                     </p>
                     <p style="margin: 8px 0 0 0; color: #721c24;">
-                        <strong>Account ID:</strong> {html_escape(account_id)}<br/>
-                        <strong>Correlation ID:</strong> <code style="background:#f4f4f4;padding:2px 6px;border-radius:3px;">{html_escape(correlation_id)}</code>
+                        <strong>Account ID:</strong> {_html_escape(account_id)}<br/>
+                        <strong>Correlation ID:</strong> <code style="background:#f4f4f4;padding:2px 6px;border-radius:3px;">{_html_escape(correlation_id)}</code>
                     </p>
                 </div>
             """
@@ -507,7 +525,7 @@ def generate_api_error_notification_email(
             "title": "🔗 Quick Links",
             "content": f"""
                 <p>
-                    <a href="https://agent.example.com/runs/{html_escape(correlation_id)}" style="color: #667eea; text-decoration: none;">View Agent Run</a> |
+                    <a href="https://agent.example.com/runs/{_html_escape(correlation_id)}" style="color: #667eea; text-decoration: none;">View Agent Run</a> |
                     <a href="https://integrations.example.com/status" style="color: #667eea; text-decoration: none;">Integration Status</a> |
                     <a href="https://docs.example.com/troubleshooting" style="color: #667eea; text-decoration: none;">Troubleshooting Guide</a>
                 </p>
@@ -755,6 +773,7 @@ def save_email_html(filename: str, html_content: str) -> str:
     filepath = os.path.join(REPORTS_DIR, filename)
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(html_content)
+    mark_reports_changed()
     return filepath
 
 
@@ -763,6 +782,7 @@ def save_report_markdown(filename: str, markdown_content: str) -> str:
     filepath = os.path.join(REPORTS_DIR, filename)
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(markdown_content)
+    mark_reports_changed()
     return filepath
 
 
@@ -771,6 +791,7 @@ def save_audit_json(filename: str, data: Dict[str, Any]) -> str:
     filepath = os.path.join(REPORTS_DIR, filename)
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, default=str)
+    mark_reports_changed()
     return filepath
 
 
@@ -790,6 +811,10 @@ def generate_full_run_report(state: Dict[str, Any]) -> Dict[str, str]:
     correlation_id = state.get("correlation_id", "unknown")
     decision = state.get("decision", "UNKNOWN")
     api_errors = state.get("api_errors", [])
+    violations = state.get("violations", {})
+    warnings = state.get("warnings", {})
+    risk_analysis = state.get("risk_analysis", {})
+    recommended_actions = (risk_analysis or {}).get("recommended_actions", [])
     timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
     
     generated_files = {}
@@ -801,9 +826,9 @@ def generate_full_run_report(state: Dict[str, Any]) -> Dict[str, str]:
         correlation_id=correlation_id,
         decision=decision,
         stage=state.get("stage", "unknown"),
-        risk_analysis=state.get("risk_analysis", {}),
-        violations=state.get("violations", {}),
-        warnings=state.get("warnings", {}),
+        risk_analysis=risk_analysis,
+        violations=violations,
+        warnings=warnings,
         actions_taken=state.get("actions_taken", []),
         notifications_sent=state.get("notifications_sent", []),
         provisioning=state.get("provisioning"),
@@ -832,9 +857,9 @@ def generate_full_run_report(state: Dict[str, Any]) -> Dict[str, str]:
             email_html = generate_blocked_notification_email(
                 account_name=account_name,
                 account_id=account_id,
-                violations=state.get("violations", {}),
-                warnings=state.get("warnings", {}),
-                recommended_actions=state.get("risk_analysis", {}).get("recommended_actions", []),
+                violations=violations,
+                warnings=warnings,
+                recommended_actions=recommended_actions,
                 correlation_id=correlation_id,
             )
             generated_files["email_html"] = save_email_html(
@@ -845,8 +870,8 @@ def generate_full_run_report(state: Dict[str, Any]) -> Dict[str, str]:
         email_html = generate_escalation_notification_email(
             account_name=account_name,
             account_id=account_id,
-            warnings=state.get("warnings", {}),
-            recommended_actions=state.get("risk_analysis", {}).get("recommended_actions", []),
+            warnings=warnings,
+            recommended_actions=recommended_actions,
             correlation_id=correlation_id,
         )
         generated_files["email_html"] = save_email_html(
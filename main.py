@@ -31,6 +31,8 @@ def _warmup_sentiment_model():
 async def lifespan(app: FastAPI):
     threading.Thread(target=_warmup_sentiment_model, daemon=True).start()
     yield
+    from app.integrations.currency import close_http_client
+    close_http_client()
 
 
 app = FastAPI(